@@ -8,29 +8,13 @@ with the tastes of the author.
 ## Load libraries/packages/modules ##
 #####################################
 
-# For general array handling:
-import numpy as np
+# For importing submodules lazily.
+import importlib
 
-# Matplotlib modules:
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 
-
-# Load submodules.
-from . import data
-from . import plot
-from . import template
-
-from .data import XData, XYData
-from .plot import SinglePlotParams, single_plot
-from .plot import SingleImshowParams, single_imshow
-from .plot import SingleHistParams, single_hist
-from .template import print_single_plot_template, print_single_imshow_template
-from .template import print_single_hist_template
-
+# Load submodules. All submodules except for ``version`` are only imported upon
+# first access of any of the objects that they define, see `__getattr__`.
 from . import version
 
 
@@ -59,6 +43,72 @@ __all__ = ["show_config"]
 
 
 
+# Objects that are imported lazily, mapped to the names of the submodules that
+# define them. The submodules themselves are also imported lazily.
+_lazy_objs = {"XData": "data",
+              "XYData": "data",
+              "SinglePlotParams": "plot",
+              "single_plot": "plot",
+              "update_single_plot": "plot",
+              "SingleImshowParams": "plot",
+              "single_imshow": "plot",
+              "SingleHistParams": "plot",
+              "single_hist": "plot",
+              "single_hist_counts": "plot",
+              "close": "plot",
+              "print_single_plot_template": "template",
+              "print_single_imshow_template": "template",
+              "print_single_hist_template": "template"}
+_lazy_submodules = ("data", "plot", "template")
+
+
+
+def __getattr__(name):
+    """Import a lazily imported object or submodule upon first access.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the object or submodule.
+
+    Returns
+    -------
+    obj : any type
+        The object or submodule.
+    """
+    if name in _lazy_submodules:
+        obj = importlib.import_module("." + name, __name__)
+    elif name in _lazy_objs:
+        submodule = importlib.import_module("." + _lazy_objs[name], __name__)
+        obj = getattr(submodule, name)
+    else:
+        raise AttributeError("module {!r} has no attribute "
+                             "{!r}".format(__name__, name))
+
+    # Subsequent accesses bypass this function.
+    globals()[name] = obj
+
+    return obj
+
+
+
+def __dir__():
+    """List the names of the module, including those imported lazily.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    names : `list` (`str`)
+        The names.
+    """
+    names = sorted(set(globals()) | set(_lazy_objs) | set(_lazy_submodules))
+
+    return names
+
+
+
 def show_config():
     """Print information about the version of qamps and libraries it uses.
 
@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+"""Contains numeric helper functions that are just-in-time compiled using
+``numba``, when it is available.
+
+``numba`` is an optional dependency of ``prettyplots``. If it is not installed,
+the helper functions fall back to pure ``numpy`` implementations.
+"""
+
+
+
+#####################################
+## Load libraries/packages/modules ##
+#####################################
+
+# For general array handling.
+import numpy as np
+
+# For just-in-time compilation of numeric helper functions (optional).
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+
+############################
+## Authorship information ##
+############################
+
+__author__     = "Matthew Fitzpatrick"
+__copyright__  = "Copyright 2020"
+__credits__    = ["Matthew Fitzpatrick"]
+__maintainer__ = "Matthew Fitzpatrick"
+__email__      = "mfitzpatrick@dwavesys.com"
+__status__     = "Development"
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in module.
+__all__ = ["jit_enabled",
+           "njit",
+           "min_max",
+           "valid_order",
+           "histogram_many"]
+
+
+
+# Set to `True` if ``numba`` is available, and `False` otherwise.
+jit_enabled = numba is not None
+
+
+
+def njit(signature, parallel=False, inline="never"):
+    r"""Decorator that compiles a function in nopython mode, if possible.
+
+    Compiled machine code is cached to disk so that it is not recompiled every
+    time ``prettyplots`` is imported. If ``numba`` is not available, then the
+    function is returned unchanged.
+
+    Parameters
+    ----------
+    signature : `str` | `list`
+        The ``numba`` signature of the function, or a list of signatures. Since
+        the signatures are given explicitly, the function is compiled eagerly,
+        i.e. upon decoration.
+    parallel : `bool`, optional
+        If set to `True`, then loops over ``numba.prange`` are parallelized.
+    inline : ``"never"`` | ``"always"``, optional
+        If set to ``"always"``, then the function is inlined into the compiled
+        functions that call it.
+
+    Returns
+    -------
+    decorator : callable
+        The decorator.
+    """
+    def decorator(func):
+        if jit_enabled:
+            func = numba.njit(signature,
+                              cache=True,
+                              parallel=parallel,
+                              inline=inline)(func)
+        return func
+
+    return decorator
+
+
+
+if jit_enabled:
+    # Writeable and read-only 1D arrays of doubles, e.g. the data arrays of
+    # :class:`prettyplots.XData` objects.
+    _float64_1d_sigs = [numba.types.Array(numba.float64, 1, "A",
+                                          readonly=readonly)
+                        for readonly in (False, True)]
+
+    # Read-only 1D arrays of floats, for data that is already in single
+    # precision.
+    _float32_1d_sig = numba.types.Array(numba.float32, 1, "A", readonly=True)
+    
+    # Writeable arrays are accepted by read-only array signatures. A writeable
+    # array signature would moreover make calls with writeable arrays
+    # ambiguous, hence only read-only array signatures are given.
+    @njit([numba.types.UniTuple(numba.float64, 2)(sig)
+           for sig in (_float64_1d_sigs[1], _float32_1d_sig)])
+    def min_max(x):
+        r"""Calculate the minimum and maximum of an array in a single pass.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The array. Must be non-empty.
+
+        Returns
+        -------
+        x_min : `float`
+            The minimum of ``x``. NaN if ``x`` contains NaN.
+        x_max : `float`
+            The maximum of ``x``. NaN if ``x`` contains NaN.
+        """
+        x_min = x[0]
+        x_max = x[0]
+        for x_i in x:
+            if x_i != x_i:
+                return np.nan, np.nan
+            if x_i < x_min:
+                x_min = x_i
+            elif x_i > x_max:
+                x_max = x_i
+
+        return x_min, x_max
+else:
+    def min_max(x):
+        r"""Calculate the minimum and maximum of an array.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The array. Must be non-empty.
+
+        Returns
+        -------
+        x_min : `float`
+            The minimum of ``x``. NaN if ``x`` contains NaN.
+        x_max : `float`
+            The maximum of ``x``. NaN if ``x`` contains NaN.
+        """
+        x_min = float(np.amin(x))
+        x_max = float(np.amax(x))
+
+        return x_min, x_max
+
+
+
+if jit_enabled:
+    # Writeable arrays are accepted by read-only array signatures, hence a 
+    # single signature suffices.
+    @njit(numba.intp[:](_float64_1d_sigs[1], _float64_1d_sigs[1],
+                        numba.boolean))
+    def valid_order(x, y, sort):
+        r"""Find the indices of the data points without NaN coordinates.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The x-coordinates of the data points.
+        y : :class:`numpy.ndarray` (`float`, ndim=1)
+            The y-coordinates of the data points, with ``y.size == x.size``.
+        sort : `bool`
+            Specifies whether the indices are to be ordered by increasing 
+            x-coordinate, rather than by increasing index. Data points with 
+            equal x-coordinates retain their relative order.
+
+        Returns
+        -------
+        idxs : :class:`numpy.ndarray` (`int`, ndim=1)
+            The indices of the data points for which neither coordinate is NaN.
+        """
+        idxs = np.empty(x.size, dtype=np.intp)
+        num_valid_points = 0
+        for idx in range(x.size):
+            if (x[idx] == x[idx]) and (y[idx] == y[idx]):
+                idxs[num_valid_points] = idx
+                num_valid_points += 1
+        idxs = idxs[:num_valid_points]
+
+        if sort:
+            idxs = idxs[np.argsort(x[idxs], kind="mergesort")]
+
+        return idxs
+else:
+    def valid_order(x, y, sort):
+        r"""Find the indices of the data points without NaN coordinates.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The x-coordinates of the data points.
+        y : :class:`numpy.ndarray` (`float`, ndim=1)
+            The y-coordinates of the data points, with ``y.size == x.size``.
+        sort : `bool`
+            Specifies whether the indices are to be ordered by increasing 
+            x-coordinate, rather than by increasing index. Data points with 
+            equal x-coordinates retain their relative order.
+
+        Returns
+        -------
+        idxs : :class:`numpy.ndarray` (`int`, ndim=1)
+            The indices of the data points for which neither coordinate is NaN.
+        """
+        idxs = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+
+        if sort:
+            idxs = idxs[np.argsort(x[idxs], kind="stable")]
+
+        return idxs
+
+
+
+if jit_enabled:
+    @njit(numba.intp(numba.float64,
+                     numba.types.Array(numba.float64, 1, "A", readonly=True),
+                     numba.float64), inline="always")
+    def _find_bin(x_i, edges, guess):
+        r"""Find the bin of a data point that lies within the bin edges.
+
+        Parameters
+        ----------
+        x_i : `float`
+            The data point.
+        edges : :class:`numpy.ndarray` (`float`, ndim=1)
+            The monotonically increasing bin edges.
+        guess : `float`
+            The guessed fractional bin index of the data point.
+
+        Returns
+        -------
+        bin_idx : `int`
+            The bin index of the data point. All bins are half-open except for
+            the last one.
+        """
+        num_bins = edges.size - 1
+
+        # If the guess is wrong, bisect the bin edges instead.
+        bin_idx = max(min(int(guess), num_bins-1), 0)
+        if ((x_i < edges[bin_idx])
+            or ((bin_idx < num_bins-1) and (x_i >= edges[bin_idx+1]))):
+            bin_idx = 0
+            upper_bin_idx = num_bins - 1
+            while bin_idx < upper_bin_idx:
+                mid_bin_idx = (bin_idx+upper_bin_idx+1) // 2
+                if x_i >= edges[mid_bin_idx]:
+                    bin_idx = mid_bin_idx
+                else:
+                    upper_bin_idx = mid_bin_idx - 1
+
+        return bin_idx
+
+    @njit([numba.void(sig,
+                      numba.types.Array(numba.float64, 1, "A", readonly=True),
+                      numba.int64[::1])
+           for sig in (_float64_1d_sigs[1], _float32_1d_sig)])
+    def _histogram_chunk(x, edges, counts):
+        r"""Add the bin counts of an array to those of a histogram.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The array.
+        edges : :class:`numpy.ndarray` (`float`, ndim=1)
+            The monotonically increasing bin edges.
+        counts : :class:`numpy.ndarray` (`int`, ndim=1, length=``edges.size``)
+            The bin counts of the histogram, updated in place. The last 
+            element is a guard bin, into which some of the elements of ``x``
+            that are NaN or that lie outside of the bins may be counted.
+
+        Returns
+        -------
+        """
+        num_bins = edges.size - 1
+        lower_edge = edges[0]
+        upper_edge = edges[-1]
+
+        # Bins are guessed in log space if the middle edge is closer to its
+        # logarithmically spaced than to its evenly spaced position, e.g. for
+        # log-scaled x-axes.
+        mid_fraction = (num_bins//2) / num_bins
+        mid_edge = edges[num_bins//2]
+        log_spaced = False
+        if lower_edge > 0:
+            log_mid_edge = lower_edge * (upper_edge/lower_edge)**mid_fraction
+            lin_mid_edge = lower_edge + (upper_edge-lower_edge)*mid_fraction
+            log_spaced = (abs(mid_edge-log_mid_edge)
+                          < abs(mid_edge-lin_mid_edge))
+        if log_spaced:
+            guess_offset = np.log(lower_edge)
+            guess_range = np.log(upper_edge) - guess_offset
+        else:
+            guess_offset = lower_edge
+            guess_range = upper_edge - lower_edge
+        norm = num_bins / guess_range if guess_range > 0 else 0.0
+
+        # The two cases are looped over separately, since branching on
+        # ``log_spaced`` per element hinders optimization. For evenly spaced 
+        # bins, elements outside of the bins, including NaN, are binned as
+        # ``lower_edge`` and then redirected to the guard bin, rather than 
+        # skipped, which avoids an unpredictable branch when many elements lie
+        # outside of the bins. For logarithmically spaced bins, skipping these
+        # elements is cheaper, since it also skips their logarithms.
+        if log_spaced:
+            for x_i in x:
+                if (x_i >= lower_edge) and (x_i <= upper_edge):
+                    guess = (np.log(x_i)-guess_offset) * norm
+                    counts[_find_bin(x_i, edges, guess)] += 1
+        else:
+            for x_i in x:
+                in_bins = (x_i >= lower_edge) & (x_i <= upper_edge)
+                x_i = x_i if in_bins else lower_edge
+                guess = (x_i-guess_offset) * norm
+                bin_idx = _find_bin(x_i, edges, guess)
+                counts[bin_idx if in_bins else num_bins] += 1
+
+        return None
+
+    @njit([numba.int64[:, :, :](sig,
+                                numba.types.Array(numba.intp, 1, "A",
+                                                  readonly=True),
+                                numba.types.Array(numba.float64, 2, "A",
+                                                  readonly=True),
+                                numba.intp)
+           for sig in (_float64_1d_sigs[1], _float32_1d_sig)],
+          parallel=True)
+    def _histogram_chunks(x, offsets, edges, num_chunks):
+        r"""Histogram the chunks of several data sets in parallel.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The concatenated data sets, in double or single precision.
+        offsets : :class:`numpy.ndarray` (`int`, ndim=1)
+            The data set ``i`` is ``x[offsets[i]:offsets[i+1]]``.
+        edges : :class:`numpy.ndarray` (`float`, ndim=2)
+            ``edges[i]`` are the monotonically increasing bin edges of the 
+            data set ``i``.
+        num_chunks : `int`
+            The number of chunks into which each data set is split.
+
+        Returns
+        -------
+        chunk_counts : :class:`numpy.ndarray` (`int`, ndim=3)
+            ``chunk_counts[i, j]`` are the bin counts of the ``j`` th chunk of
+            the data set ``i``, followed by a guard bin, see 
+            `_histogram_chunk`.
+        """
+        num_x_data_sets = offsets.size - 1
+        num_bins = edges.shape[1] - 1
+
+        # Every chunk has its own bin counts, so that no two threads update
+        # the same counts.
+        chunk_counts = np.zeros((num_x_data_sets, num_chunks, num_bins+1),
+                                dtype=np.int64)
+        for task_idx in numba.prange(num_x_data_sets*num_chunks):
+            set_idx = task_idx // num_chunks
+            chunk_idx = task_idx % num_chunks
+            set_size = offsets[set_idx+1] - offsets[set_idx]
+            start = offsets[set_idx] + (set_size*chunk_idx) // num_chunks
+            stop = offsets[set_idx] + (set_size*(chunk_idx+1)) // num_chunks
+            _histogram_chunk(x[start:stop], edges[set_idx],
+                             chunk_counts[set_idx, chunk_idx])
+
+        return chunk_counts
+
+    def histogram_many(x, offsets, edges):
+        r"""Histogram several data sets at once.
+
+        Each data set is split into as many chunks as there are ``numba`` 
+        threads, and the chunks of all data sets are histogrammed in parallel.
+        The bins are the same as those of :func:`numpy.histogram`, i.e. all
+        bins are half-open except for the last one, and data points that are 
+        NaN or that lie outside of the bins are not counted.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The concatenated data sets, in double or single precision.
+        offsets : :class:`numpy.ndarray` (`int`, ndim=1)
+            The data set ``i`` is ``x[offsets[i]:offsets[i+1]]``.
+        edges : :class:`numpy.ndarray` (`float`, ndim=2)
+            ``edges[i]`` are the monotonically increasing bin edges of the 
+            data set ``i``.
+
+        Returns
+        -------
+        counts_set : :class:`numpy.ndarray` (`int`, ndim=2)
+            ``counts_set[i]`` are the bin counts of the data set ``i``.
+        """
+        chunk_counts = _histogram_chunks(x,
+                                         np.asarray(offsets, dtype=np.intp),
+                                         edges,
+                                         numba.get_num_threads())
+        counts_set = chunk_counts[:, :, :-1].sum(axis=1)
+
+        return counts_set
+else:
+    def histogram_many(x, offsets, edges):
+        r"""Histogram several data sets at once.
+
+        The bins are the same as those of :func:`numpy.histogram`, i.e. all 
+        bins are half-open except for the last one, and data points that are 
+        NaN or that lie outside of the bins are not counted.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray` (`float`, ndim=1)
+            The concatenated data sets, in double or single precision.
+        offsets : :class:`numpy.ndarray` (`int`, ndim=1)
+            The data set ``i`` is ``x[offsets[i]:offsets[i+1]]``.
+        edges : :class:`numpy.ndarray` (`float`, ndim=2)
+            ``edges[i]`` are the monotonically increasing bin edges of the 
+            data set ``i``.
+
+        Returns
+        -------
+        counts_set : :class:`numpy.ndarray` (`int`, ndim=2)
+            ``counts_set[i]`` are the bin counts of the data set ``i``.
+        """
+        num_x_data_sets = offsets.size - 1
+        num_bins = edges.shape[1] - 1
+        counts_set = np.zeros((num_x_data_sets, num_bins), dtype=np.int64)
+        
+        for set_idx in range(num_x_data_sets):
+            x_data_set = x[offsets[set_idx]:offsets[set_idx+1]]
+            counts_set[set_idx] = np.histogram(x_data_set,
+                                               bins=edges[set_idx])[0]
+
+        return counts_set
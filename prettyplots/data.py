@@ -13,6 +13,11 @@ import copy
 
 
 
+# For general array handling.
+import numpy as np
+
+
+
 ############################
 ## Authorship information ##
 ############################
@@ -35,26 +40,120 @@ __all__ = ["XData", "XYData"]
 
 
 
+def _to_float_array(a):
+    r"""Copy numeric data into a C-contiguous floating-point numpy array.
+
+    Parameters
+    ----------
+    a : array_like
+        The data to be copied.
+
+    Returns
+    -------
+    a_array : :class:`numpy.ndarray` | array_like
+        If ``a`` is of single precision, then ``a_array`` is a single 
+        precision copy of ``a``. If ``a`` is of any other numeric type, then
+        ``a_array`` is a double precision copy of ``a``. Masks of masked arrays
+        are preserved. If ``a`` is not numeric, e.g. if it consists of dates or
+        strings, then ``a_array`` is a deep copy of ``a``. Copies that are 
+        numpy arrays are made read-only.
+    """
+    a_array = np.asanyarray(a)
+    if a_array.dtype.kind not in "biuf":
+        a_array = copy.deepcopy(a)
+    else:
+        dtype = np.float32 if a_array.dtype == np.float32 else np.float64
+        if isinstance(a_array, np.ma.MaskedArray):
+            a_array = np.ma.array(a_array, dtype=dtype, copy=True, order='C')
+        else:
+            a_array = np.array(a_array, dtype=dtype, copy=True, order='C')
+
+    if isinstance(a_array, np.ndarray):
+        a_array.flags.writeable = False
+
+    return a_array
+
+
+
+def _to_err_array(err, num_points):
+    r"""Convert error bar data into a canonical array of shape ``(2, N)``.
+
+    Parameters
+    ----------
+    err : `float` | array_like(`float`, ndim=1) | array_like(`float`, ndim=2) | `None`
+        The error bar data, as described in the documentation for 
+        :class:`prettyplots.XYData`.
+    num_points : `int`
+        The number of data points :math:`N`.
+
+    Returns
+    -------
+    err_array : :class:`numpy.ndarray` (`float`, shape=(2, ``num_points``)) | `None`
+        ``err_array[0, i]`` and ``err_array[1, i]`` are the sizes of the '-' 
+        and '+' error bars respectively for the :math:`i^{\mathrm{th}}` data
+        point. If ``err`` is `None`, then ``err_array`` is `None`.
+    """
+    if err is None:
+        return None
+
+    err_array = _to_float_array(err)
+    if err_array.ndim < 2:
+        err_array = np.broadcast_to(err_array, (2, num_points)).copy()
+        err_array.flags.writeable = False
+    elif err_array.shape != (2, num_points):
+        raise ValueError("Error bar data of shape {} is incompatible with {} "
+                         "data point(s).".format(err_array.shape, num_points))
+
+    return err_array
+
+
+
 class XData():
-    r"""Simple data class to store x data for plotting.
+    r"""Simple immutable data class to store x data for plotting.
+
+    Instances cannot be modified after construction, and their data arrays are
+    read-only. Hence instances can be safely used as keys for caching, with 
+    hashing and equality based on identity.
 
     Parameters
     ----------
     x : array_like(`float`, ndim=1)
         The x-data.
+
     Attributes
     ----------
-    Same as parameters.
+    x : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+        A C-contiguous copy of the x-data. Numeric data is stored in single
+        precision if it was given in single precision, and in double precision
+        otherwise. Non-numeric data, e.g. dates, is stored as given.
     """
+    __slots__ = ("x", "__weakref__")
+    
     def __init__(self, x):
-        self.x = copy.deepcopy(x)
+        object.__setattr__(self, "x", _to_float_array(x))
 
         return None
 
 
 
+    def __setattr__(self, name, value):
+        raise AttributeError("{} objects are immutable.".format(
+            type(self).__name__))
+
+
+
+    def __delattr__(self, name):
+        raise AttributeError("{} objects are immutable.".format(
+            type(self).__name__))
+
+
+
 class XYData():
-    r"""Simple data class to store x and y data for plotting.
+    r"""Simple immutable data class to store x and y data for plotting.
+
+    Instances cannot be modified after construction, and their data arrays are
+    read-only. Hence instances can be safely used as keys for caching, with 
+    hashing and equality based on identity.
 
     Parameters
     ----------
@@ -72,14 +171,246 @@ class XYData():
         '+' and '-' error bars for each data point. If ``yerr`` is a 
         one-dimensional array, then ``yerr[i]`` is the size of the '+' and '-'
         error bars for the :math:`i^{\mathrm{th}}` data point.
+
     Attributes
     ----------
-    Same as parameters.
+    x : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+        A C-contiguous copy of the x-data. Numeric data is stored in single
+        precision if it was given in single precision, and in double precision
+        otherwise. Non-numeric data, e.g. dates, is stored as given.
+    y : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+        A C-contiguous copy of the y-data, stored like ``x``.
+    xerr : :class:`numpy.ndarray` (`float`, shape=(2, x.size)) | `None`
+        The x error in canonical form: ``xerr[0, i]`` and ``xerr[1, i]`` are
+        the sizes of the '-' and '+' error bars respectively for the 
+        :math:`i^{\mathrm{th}}` data point.
+    yerr : :class:`numpy.ndarray` (`float`, shape=(2, y.size)) | `None`
+        The y error in canonical form, analogous to ``xerr``.
     """
+    # ``_previews`` caches the results of :meth:`XYData.preview`.
+    __slots__ = ("x", "y", "xerr", "yerr", "_previews", "__weakref__")
+    
     def __init__(self, x, y, xerr=None, yerr=None):
-        self.x = copy.deepcopy(x)
-        self.y = copy.deepcopy(y)
-        self.xerr = copy.deepcopy(xerr)
-        self.yerr = copy.deepcopy(yerr)
+        x = _to_float_array(x)
+        y = _to_float_array(y)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "xerr", _to_err_array(xerr, np.size(x)))
+        object.__setattr__(self, "yerr", _to_err_array(yerr, np.size(y)))
+        object.__setattr__(self, "_previews", {})
 
         return None
+
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} objects are immutable.".format(
+            type(self).__name__))
+
+
+
+    def __delattr__(self, name):
+        raise AttributeError("{} objects are immutable.".format(
+            type(self).__name__))
+
+
+
+    def preview(self, resolution=2048):
+        r"""Return a downsampled version of the data for fast rendering.
+
+        The data points are split into ``resolution`` buckets of consecutive
+        points, and only the points with the minimum and maximum y-values of 
+        each bucket are kept, in their original order. Curves drawn through the
+        downsampled data are visually indistinguishable from curves drawn 
+        through the full data, as long as they are rendered at no more than 
+        ``resolution`` pixels across. Since the data is immutable, the result
+        is computed once per resolution and cached.
+
+        Parameters
+        ----------
+        resolution : `int`, optional
+            The number of buckets.
+
+        Returns
+        -------
+        x : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+            The downsampled x-data, with at most ``2*resolution`` points. If 
+            the data contains no more than ``2*resolution`` points, or if the
+            y-data is not numeric, then ``x`` is the full x-data.
+        y : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+            The corresponding downsampled y-data.
+        """
+        if resolution in self._previews:
+            return self._previews[resolution]
+
+        x = self.x
+        y = self.y
+        num_points = np.size(y)
+        
+        if ((num_points <= 2*resolution)
+            or (not isinstance(y, np.ndarray))
+            or (y.dtype.kind != "f")):
+            result = (x, y)
+        else:
+            bucket_size = -(-num_points // resolution)  # Ceiling division.
+            num_buckets = -(-num_points // bucket_size)
+            
+            # Pad the last bucket by repeating the last data point.
+            idxs = np.minimum(np.arange(num_buckets*bucket_size),
+                              num_points-1).reshape(num_buckets, bucket_size)
+            y_buckets = y[idxs]
+            offsets = np.arange(num_buckets) * bucket_size
+            min_idxs = offsets + np.argmin(y_buckets, axis=1)
+            max_idxs = offsets + np.argmax(y_buckets, axis=1)
+            
+            preview_idxs = np.empty(2*num_buckets, dtype=np.intp)
+            preview_idxs[0::2] = np.minimum(min_idxs, max_idxs)
+            preview_idxs[1::2] = np.maximum(min_idxs, max_idxs)
+            result = (np.asarray(x)[preview_idxs], y[preview_idxs])
+
+        self._previews[resolution] = result
+
+        return result
+
+
+
+    @classmethod
+    def from_structured(cls, arr, x_col=0, y_col=1):
+        r"""Construct an xy data set from columns or fields of a single array.
+
+        If the selected columns or fields are of floating-point type, the 
+        resulting xy data set stores read-only views of them rather than copies,
+        i.e. the data is not copied. In this case, the data arrays need not be 
+        C-contiguous, and ``arr`` must not be modified afterwards, since 
+        :class:`prettyplots.XYData` objects are assumed to be immutable. 
+        Otherwise, the data is copied as described in the documentation for
+        :class:`prettyplots.XYData`.
+
+        Parameters
+        ----------
+        arr : array_like(`float`, ndim=2) | :class:`numpy.ndarray` (ndim=1)
+            The array, either with one column per variable, or of a structured
+            data type with one field per variable.
+        x_col : `int` | `str`, optional
+            The column index or field name of the x-data.
+        y_col : `int` | `str`, optional
+            The column index or field name of the y-data.
+
+        Returns
+        -------
+        xy_data : :class:`prettyplots.XYData`
+            The xy data set, without error bars.
+        """
+        arr = np.asarray(arr)
+        if arr.dtype.names is not None:
+            x = arr[x_col]
+            y = arr[y_col]
+        else:
+            x = arr[:, x_col]
+            y = arr[:, y_col]
+
+        if ((x.dtype not in (np.float32, np.float64))
+            or (y.dtype not in (np.float32, np.float64))):
+            return cls(x, y)
+
+        # Read-only views of ``arr``.
+        x = x.view()
+        y = y.view()
+        x.flags.writeable = False
+        y.flags.writeable = False
+        
+        xy_data = cls.__new__(cls)
+        object.__setattr__(xy_data, "x", x)
+        object.__setattr__(xy_data, "y", y)
+        object.__setattr__(xy_data, "xerr", None)
+        object.__setattr__(xy_data, "yerr", None)
+        object.__setattr__(xy_data, "_previews", {})
+
+        return xy_data
+
+
+
+    def as_soa(self):
+        r"""Return the x- and y-data as a pair of arrays, without copying.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        x : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+            The x-data.
+        y : :class:`numpy.ndarray` (`float`, ndim=1) | array_like
+            The y-data.
+        """
+        return self.x, self.y
+
+
+
+    def cleaned(self, sort=False):
+        r"""Return a copy of the xy data set without NaN data points.
+
+        The data points for which either coordinate is NaN or masked are 
+        removed, along with their error bars. The filtering, and optionally 
+        sorting, is performed in a single compiled pass if ``numba`` is 
+        installed.
+
+        Parameters
+        ----------
+        sort : `bool`, optional
+            If set to `True`, the remaining data points are sorted by 
+            increasing x-coordinate, keeping the relative order of data points
+            with equal x-coordinates. Note that sorting changes the appearance
+            of curves whose x-data is not monotonic, e.g. parametric curves.
+
+        Returns
+        -------
+        xy_data : :class:`prettyplots.XYData`
+            The cleaned xy data set. The data is stored in double precision.
+        """
+        # Imported here so that ``numba`` is only loaded if needed.
+        from prettyplots._jit import valid_order
+
+        try:
+            x = np.ma.filled(np.ma.asarray(self.x, dtype=np.float64), np.nan)
+            y = np.ma.filled(np.ma.asarray(self.y, dtype=np.float64), np.nan)
+        except (TypeError, ValueError) as e:
+            raise TypeError("Only numeric xy data sets can be "
+                            "cleaned.") from e
+        idxs = valid_order(np.ravel(x), np.ravel(y), sort)
+
+        xy_data = type(self).__new__(type(self))
+        for attr_name, data in (("x", x), ("y", y),
+                                ("xerr", self.xerr), ("yerr", self.yerr)):
+            if data is not None:
+                data = np.ascontiguousarray(data[..., idxs])
+                data.flags.writeable = False
+            object.__setattr__(xy_data, attr_name, data)
+        object.__setattr__(xy_data, "_previews", {})
+
+        return xy_data
+
+
+
+    @staticmethod
+    def stack(xy_data_sets):
+        r"""Concatenate the data of several xy data sets into a single array.
+
+        Parameters
+        ----------
+        xy_data_sets : `array_like` (:class:`prettyplots.XYData`, ndim=1)
+            The xy data sets.
+
+        Returns
+        -------
+        xy : :class:`numpy.ndarray` (`float`, ndim=2)
+            An array of shape ``(2, N)``, with :math:`N` being the total 
+            number of data points: ``xy[0]`` and ``xy[1]`` are the 
+            concatenated x- and y-data of the xy data sets respectively.
+        """
+        xy = np.concatenate([np.stack((np.ravel(xy_data_set.x),
+                                       np.ravel(xy_data_set.y)))
+                             for xy_data_set in xy_data_sets],
+                            axis=1)
+
+        return xy
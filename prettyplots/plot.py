@@ -8,67 +8,1376 @@
 ## Load libraries/packages/modules ##
 #####################################
 
+# For hashing array data when computing plotting parameter signatures.
+import hashlib
+
+# For caching figures in order of last use.
+import collections
+
+# For caching colormaps.
+import functools
+
+# For keeping track of plotted artists and data sets without keeping them alive.
+import weakref
+
+# For rendering figures to memory before saving them.
+import io
+
+
+
 # For general array handling.
 import numpy as np
 
-# Matplotlib modules.
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator
-from mpl_toolkits.axes_grid1 import make_axes_locatable
+# Data classes.
+from prettyplots.data import XData, XYData
+
+
+
+# Importing matplotlib is slow, hence the following modules and objects are 
+# only imported upon the first call to a plotting function, see 
+# `_lazy_import`. Modules that are only needed by a single plotting function,
+# e.g. the just-in-time compiled numeric helpers, which may import numba, are
+# imported by that function.
+mpl = None
+plt = None
+MultipleLocator = None
+LineCollection = None
+PolyCollection = None
+Line2D = None
+
+
+
+############################
+## Authorship information ##
+############################
+
+__author__     = "Matthew Fitzpatrick"
+__copyright__  = "Copyright 2020"
+__credits__    = ["Matthew Fitzpatrick"]
+__maintainer__ = "Matthew Fitzpatrick"
+__email__      = "mfitzpatrick@dwavesys.com"
+__status__     = "Development"
+
+
+
+##################################
+## Define classes and functions ##
+##################################
+
+# List of public objects in objects.
+__all__ = ["SinglePlotParams",
+           "single_plot",
+           "update_single_plot",
+           "SingleImshowParams",
+           "single_imshow",
+           "SingleHistParams",
+           "single_hist",
+           "single_hist_counts",
+           "close"]
+
+
+
+def _lazy_import():
+    r"""Import the matplotlib modules used by all plotting functions.
+
+    The imported modules and objects are bound to the corresponding global
+    variables of this module. Subsequent calls do nothing.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    """
+    global mpl, plt, MultipleLocator, LineCollection, PolyCollection, Line2D
+    
+    if plt is not None:
+        return None
+
+    # Matplotlib modules.
+    import matplotlib
+    import matplotlib.pyplot
+    import matplotlib.ticker
+    import matplotlib.collections
+    import matplotlib.lines
+
+    mpl = matplotlib
+    MultipleLocator = matplotlib.ticker.MultipleLocator
+    LineCollection = matplotlib.collections.LineCollection
+    PolyCollection = matplotlib.collections.PolyCollection
+    Line2D = matplotlib.lines.Line2D
+    plt = matplotlib.pyplot
+
+    return None
+
+
+
+def _broadcast(param, num_data_sets):
+    r"""Broadcast a per-data-set plotting parameter to a list.
+
+    Parameters
+    ----------
+    param : `None` | scalar | array_like
+        The plotting parameter, e.g. :attr:`SingleHistParams.alphas`. If 
+        ``param`` is `None`, a scalar, or a sequence of length one, then its
+        value applies to every data set. Otherwise, ``param[i]`` applies to 
+        the ``i`` th data set.
+    num_data_sets : `int`
+        The number of data sets.
+
+    Returns
+    -------
+    broadcast_param : `array_like`
+        The values of ``param`` for each data set. If ``param`` is a sequence
+        whose length is not one, then ``broadcast_param`` is ``param`` itself
+        rather than a copy.
+    """
+    if not isinstance(param, (list, tuple, np.ndarray)):
+        broadcast_param = [param] * num_data_sets
+    elif len(param) == 1:
+        broadcast_param = [param[0]] * num_data_sets
+    else:
+        broadcast_param = param
+
+    return broadcast_param
+
+
+
+def _to_contiguous_array(a):
+    r"""Convert numeric data to a C-contiguous floating-point numpy array.
+
+    Matplotlib processes C-contiguous floating-point arrays without any 
+    intermediate conversions, unlike e.g. lists, integer arrays, or strided 
+    views.
+
+    Parameters
+    ----------
+    a : array_like | `None`
+        The data to be converted.
+
+    Returns
+    -------
+    a_array : :class:`numpy.ndarray` | array_like | `None`
+        If ``a`` is already a C-contiguous single or double precision numpy 
+        array, then ``a_array`` is ``a`` itself. If ``a`` is of any other 
+        numeric type, then ``a_array`` is a double precision C-contiguous copy
+        of ``a``. If ``a`` is `None`, a masked array, or not numeric, then
+        ``a_array`` is ``a``.
+    """
+    if (a is None) or isinstance(a, np.ma.MaskedArray):
+        return a
+
+    a_array = np.asarray(a)
+    if a_array.dtype.kind not in "biuf":
+        a_array = a
+    elif a_array.dtype not in (np.float32, np.float64):
+        a_array = np.ascontiguousarray(a_array, dtype=np.float64)
+    else:
+        a_array = np.ascontiguousarray(a_array)
+
+    return a_array
+
+
+
+def _default_colors(num_colors):
+    r"""Get the first few colors of the default matplotlib color cycle.
+
+    Parameters
+    ----------
+    num_colors : `int`
+        The number of colors to get. If ``num_colors`` exceeds the length of
+        the color cycle, then the color cycle is repeated.
+
+    Returns
+    -------
+    colors : `list` (`str`, ndim=1)
+        The colors.
+    """
+    color_cycle = mpl.rcParams['axes.prop_cycle'].by_key().get('color',
+                                                               ['C0'])
+    colors = [color_cycle[idx % len(color_cycle)] for idx in range(num_colors)]
+
+    return colors
+
+
+
+# The number of xy data sets plotted on each axes, and the artists 
+# representing them, see `_plot_xy_data_sets` and `update_single_plot`.
+_data_artists = weakref.WeakKeyDictionary()
+
+
+
+# Linestyles for which no curve is drawn.
+_none_linestyles = ("none", "None", "", " ")
+
+
+
+def _unpack_xy_data_sets(xy_data_sets):
+    r"""Unpack the data arrays of a sequence of xy data sets.
+
+    Parameters
+    ----------
+    xy_data_sets : `array_like` (:class:`prettyplots.XYData`, ndim=1)
+        The xy data sets.
+
+    Returns
+    -------
+    xs : `list` (`array_like` (`float`, ndim=1))
+        ``xs[i]`` is the x data of the ``i`` th xy data set.
+    ys : `list` (`array_like` (`float`, ndim=1))
+        ``ys[i]`` is the y data of the ``i`` th xy data set.
+    xerrs : `list` (`array_like` (`float`) | `None`)
+        ``xerrs[i]`` is the x error bar data of the ``i`` th xy data set.
+    yerrs : `list` (`array_like` (`float`) | `None`)
+        ``yerrs[i]`` is the y error bar data of the ``i`` th xy data set.
+    """
+    xs = [xy_data_set.x for xy_data_set in xy_data_sets]
+    ys = [xy_data_set.y for xy_data_set in xy_data_sets]
+    xerrs = [xy_data_set.xerr for xy_data_set in xy_data_sets]
+    yerrs = [xy_data_set.yerr for xy_data_set in xy_data_sets]
+
+    return xs, ys, xerrs, yerrs
+
+
+
+def _plot_xy_data_sets(ax, xs, ys, xerrs, yerrs, scatterplot, colors,
+                       markers, linestyles, legend_labels, linewidth,
+                       markersize, batch_curves):
+    r"""Plot xy data sets with respect to a single y-scale.
+
+    Curves without error bars are batched into a single
+    :class:`matplotlib.collections.LineCollection`, and markers of xy data 
+    sets without error bars are batched into a single 
+    :meth:`matplotlib.axes.Axes.scatter` call per marker, so that the number 
+    of artists does not grow with the number of xy data sets. Curves whose
+    linestyle is ``'none'`` are not drawn. All other xy data sets, and all xy
+    data sets that are not displayed as scatter plots if ``batch_curves`` is
+    `False`, are plotted individually with 
+    :meth:`matplotlib.axes.Axes.errorbar`.
+
+    Parameters
+    ----------
+    ax : :class:`matplotlib.axes.Axes`
+        The axes on which to plot the xy data sets.
+    xs : `array_like` (`array_like` (`float`, ndim=1), ndim=1)
+        ``xs[i]`` is the x data of the ``i`` th xy data set. If ``xs`` and 
+        ``ys`` are both :class:`numpy.ndarray` objects of the same shape, 
+        then the curves are batched without copying the data set by data set.
+    ys : `array_like` (`array_like` (`float`, ndim=1), ndim=1)
+        ``ys[i]`` is the y data of the ``i`` th xy data set.
+    xerrs : `array_like` (`array_like` (`float`) | `None`, ndim=1)
+        ``xerrs[i]`` is the x error bar data of the ``i`` th xy data set.
+    yerrs : `array_like` (`array_like` (`float`) | `None`, ndim=1)
+        ``yerrs[i]`` is the y error bar data of the ``i`` th xy data set.
+    scatterplot : `bool`
+        Specifies whether the xy data sets are to be displayed as scatter
+        plots or not.
+    colors : `array_like` (`str` | `None`, ndim=1)
+        ``colors[i]`` specifies the color of the ``i`` th xy data set. If
+        ``colors[i]`` is `None`, then the ``i`` th color of the default color
+        cycle is used.
+    markers : `array_like` (`str` | `None`, ndim=1)
+        ``markers[i]`` specifies the marker of the ``i`` th xy data set.
+    linestyles : `array_like` (`str` | `None`, ndim=1)
+        ``linestyles[i]`` specifies the linestyle of the ``i`` th xy data set.
+    legend_labels : `array_like` (`str` | `None`, ndim=1)
+        ``legend_labels[i]`` specifies the legend label of the ``i`` th xy
+        data set.
+    linewidth : `float`
+        The width of the data curves.
+    markersize : `float`
+        The size of the markers (if used).
+    batch_curves : `bool`
+        Specifies whether curves may be batched. Matplotlib's search for the
+        best legend location ignores the curves of a 
+        :class:`matplotlib.collections.LineCollection`, hence curves must not
+        be batched on axes that have such a legend.
+
+    Returns
+    -------
+    plot_handles : `list` (:class:`matplotlib.artist.Artist`, ndim=1)
+        ``plot_handles[i]`` is the legend handle of the ``i`` th xy data set.
+    """
+    num_xy_data_sets = len(ys)
+    stacked = isinstance(xs, np.ndarray) and isinstance(ys, np.ndarray)
+    default_colors = _default_colors(num_xy_data_sets)
+    colors = [default_colors[idx] if colors[idx] is None else colors[idx]
+              for idx in range(num_xy_data_sets)]
+    linestyles = [mpl.rcParams['lines.linestyle'] if linestyle is None
+                  else linestyle
+                  for linestyle in linestyles[:num_xy_data_sets]]
+
+    # Xy data sets without error bars, which are batched.
+    plain_idxs = [idx for idx in range(num_xy_data_sets)
+                  if (xerrs[idx] is None) and (yerrs[idx] is None)
+                  and (scatterplot or batch_curves)]
+
+    batched_idxs = []
+    scatter_idxs_by_marker = {}
+    if scatterplot:
+        default_marker = mpl.rcParams['scatter.marker']
+        for idx in plain_idxs:
+            marker = default_marker if markers[idx] is None else markers[idx]
+            scatter_idxs_by_marker.setdefault(marker, []).append(idx)
+    else:
+        batched_idxs = [idx for idx in plain_idxs
+                        if linestyles[idx] not in _none_linestyles]
+        for idx in plain_idxs:
+            if markers[idx] is not None:
+                scatter_idxs_by_marker.setdefault(markers[idx],
+                                                  []).append(idx)
+
+    plot_handles = [None] * num_xy_data_sets
+    data_artists = []
+    
+    if len(batched_idxs) > 0:
+        if stacked:
+            segments = np.stack((xs[batched_idxs], ys[batched_idxs]), axis=-1)
+        else:
+            segments = [np.column_stack((xs[idx], ys[idx]))
+                        for idx in batched_idxs]
+        line_collection = LineCollection(segments,
+                                         colors=[colors[idx]
+                                                 for idx in batched_idxs],
+                                         linestyles=[linestyles[idx]
+                                                     for idx in batched_idxs],
+                                         linewidths=linewidth)
+        ax.add_collection(line_collection)
+        ax.autoscale_view()
+        data_artists.append(("lines", weakref.ref(line_collection),
+                             batched_idxs, None))
+
+    for marker, scatter_idxs in scatter_idxs_by_marker.items():
+        if stacked:
+            x = xs[scatter_idxs].ravel()
+            y = ys[scatter_idxs].ravel()
+        else:
+            x = np.concatenate([np.ravel(xs[idx]) for idx in scatter_idxs])
+            y = np.concatenate([np.ravel(ys[idx]) for idx in scatter_idxs])
+        rgba_colors = mpl.colors.to_rgba_array([colors[idx]
+                                                for idx in scatter_idxs])
+        point_colors = np.repeat(rgba_colors,
+                                 [np.size(xs[idx]) for idx in scatter_idxs],
+                                 axis=0)
+        # Markers on curves are drawn at the same z-order as the curves.
+        zorder = None if scatterplot else LineCollection.zorder
+        path_collection = ax.scatter(x, y, s=markersize**2, c=point_colors,
+                                     marker=marker,
+                                     linewidths=mpl.rcParams['lines.'
+                                                             'markeredgewidth'],
+                                     edgecolors='face',
+                                     zorder=zorder)
+        data_artists.append(("scatter", weakref.ref(path_collection),
+                             scatter_idxs, rgba_colors))
+
+    # Proxy artists for the legend.
+    for idx in plain_idxs:
+        if scatterplot:
+            marker = default_marker if markers[idx] is None else markers[idx]
+            linestyle = 'none'
+        else:
+            marker = markers[idx]
+            linestyle = linestyles[idx]
+        plot_handles[idx] = Line2D([], [],
+                                   ls=linestyle,
+                                   c=colors[idx],
+                                   lw=linewidth,
+                                   marker=marker,
+                                   markersize=markersize,
+                                   label=legend_labels[idx])
+
+    for idx in range(num_xy_data_sets):
+        if plot_handles[idx] is not None:
+            continue
+        
+        x = _to_contiguous_array(xs[idx])
+        y = _to_contiguous_array(ys[idx])
+
+        xerr = _to_contiguous_array(xerrs[idx])
+        yerr = _to_contiguous_array(yerrs[idx])
+
+        if scatterplot:
+            errorbar_kwargs = {"marker": markers[idx],
+                               "c": colors[idx],
+                               "markersize": markersize,
+                               "label": legend_labels[idx],
+                               "ls": 'none'}
+        else:
+            errorbar_kwargs = {"ls": linestyles[idx],
+                               "c": colors[idx],
+                               "lw": linewidth,
+                               "label": legend_labels[idx],
+                               "marker": markers[idx],
+                               "markersize": markersize}
+        plot_handles[idx] = ax.errorbar(x, y, xerr=xerr, yerr=yerr,
+                                        **errorbar_kwargs)
+
+        # Error bar containers do not support weak references, hence the data
+        # line of the container is tracked instead.
+        data_artists.append(("errorbar", weakref.ref(plot_handles[idx][0]),
+                             [idx], errorbar_kwargs))
+
+    _data_artists[ax] = (num_xy_data_sets, data_artists)
+
+    return plot_handles
+
+
+
+def update_single_plot(fig, ax, xy_data_sets, rescale=True):
+    r"""Update the data of xy data sets plotted by :func:`single_plot`.
+
+    Rather than regenerating the figure, the existing artists are updated in
+    place. The styles of the xy data sets are left unchanged.
+
+    Figures generated from plotting parameters constructed by 
+    :meth:`SinglePlotParams.from_arrays` are supported as well, although the
+    new data must still be given as :class:`prettyplots.XYData` objects. 
+    Artists that have been removed from ``ax`` since, e.g. via 
+    :meth:`matplotlib.artist.Artist.remove`, are skipped, hence the 
+    corresponding xy data sets are neither redrawn nor taken into account 
+    when rescaling the axis limits. Artists added to ``ax`` by other means 
+    than :func:`single_plot` are not updated either. Since the figure no 
+    longer corresponds to the plotting parameters used to generate it, it is
+    not returned by subsequent calls to :func:`single_plot` with the same 
+    plotting parameters.
+
+    Parameters
+    ----------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure returned by :func:`single_plot`.
+    ax : :class:`matplotlib.axes.Axes`
+        One of the axes returned by :func:`single_plot`.
+    xy_data_sets : `array_like` (:class:`prettyplots.XYData`, ndim=1)
+        The new xy data sets, one for each xy data set originally plotted on 
+        ``ax``, in the same order. Xy data sets originally plotted without 
+        error bars must not have error bars.
+    rescale : `bool`, optional
+        If set to `True`, the axis limits are rescaled to fit the new data,
+        overriding any limits specified upon calling :func:`single_plot`. 
+        Otherwise, the axis limits are left unchanged.
+
+    Returns
+    -------
+    None
+        The figure is modified in place, and redrawn lazily, see
+        :meth:`matplotlib.backend_bases.FigureCanvasBase.draw_idle`.
+
+    Raises
+    ------
+    ValueError
+        If ``ax`` was not returned by :func:`single_plot`, if the number of 
+        xy data sets differs from the number originally plotted on ``ax``, or
+        if error bars are added to xy data sets plotted without them.
+    """
+    if ax not in _data_artists:
+        raise ValueError("`ax` was not returned by `single_plot`.")
+    num_xy_data_sets, data_artists = _data_artists[ax]
+
+    if len(xy_data_sets) != num_xy_data_sets:
+        raise ValueError("`xy_data_sets` must contain {} xy data "
+                         "set(s).".format(num_xy_data_sets))
+    xs, ys, xerrs, yerrs = _unpack_xy_data_sets(xy_data_sets)
+
+    collection_points = []
+    for entry_idx, entry in enumerate(data_artists):
+        kind, artist_ref, idxs, extra = entry
+        artist = artist_ref()
+        if artist is None:  # The artist has been removed.
+            continue
+
+        if kind == "errorbar":
+            idx = idxs[0]
+            container = next(container for container in ax.containers
+                             if container[0] is artist)
+            container.remove()
+            container = ax.errorbar(_to_contiguous_array(xs[idx]),
+                                    _to_contiguous_array(ys[idx]),
+                                    xerr=_to_contiguous_array(xerrs[idx]),
+                                    yerr=_to_contiguous_array(yerrs[idx]),
+                                    **extra)
+            data_artists[entry_idx] = (kind, weakref.ref(container[0]),
+                                       idxs, extra)
+            continue
+            
+        if any((xerrs[idx] is not None) or (yerrs[idx] is not None)
+               for idx in idxs):
+            raise ValueError("Cannot add error bars to xy data sets that "
+                             "were plotted without error bars.")
+        
+        if kind == "lines":
+            segments = [np.column_stack((xs[idx], ys[idx])) for idx in idxs]
+            artist.set_segments(segments)
+            points = np.concatenate(segments)
+        else:
+            points = np.column_stack((np.concatenate([np.ravel(xs[idx])
+                                                      for idx in idxs]),
+                                      np.concatenate([np.ravel(ys[idx])
+                                                      for idx in idxs])))
+            artist.set_offsets(points)
+            artist.set_facecolors(np.repeat(extra,
+                                            [np.size(xs[idx])
+                                             for idx in idxs],
+                                            axis=0))
+        collection_points.append(points)
+
+    # The figure no longer matches the parameters used to generate it, hence it
+    # must not be returned by subsequent calls with the same parameters.
+    for func_name, result in tuple(_last_results.items()):
+        if result[0] is fig:
+            del _last_results[func_name]
+            del _last_signatures[func_name]
+
+    if rescale:
+        ax.relim()
+        for points in collection_points:
+            # Collections are not taken into account by ``relim``.
+            ax.update_datalim(points)
+        ax.set_autoscale_on(True)
+        ax.autoscale_view()
+    fig.canvas.draw_idle()
+
+    return None
+
+
+
+
+def _multiple_locator(axis, spacing, which):
+    r"""Get a tick locator with a fixed tick spacing for an axis.
+
+    Locators are cached per axis, so that axes that are reused by the plotting
+    functions, see `_reuse_cached_fig`, also reuse their locators. Locators
+    are not shared between different axes, since a locator computes the ticks
+    of the last axis to which it was attached.
+
+    The cache is stored as an attribute of ``axis`` rather than in a 
+    module-level mapping, since the locators refer back to ``axis``, which 
+    would keep ``axis`` alive even in a weak mapping.
+
+    Parameters
+    ----------
+    axis : :class:`matplotlib.axis.Axis`
+        The axis.
+    spacing : `float`
+        The spacing between adjacent ticks.
+    which : ``'major'`` | ``'minor'``
+        The kind of ticks to be located.
+
+    Returns
+    -------
+    locator : :class:`matplotlib.ticker.MultipleLocator`
+        The tick locator.
+    """
+    locators = getattr(axis, "_prettyplots_locators", None)
+    if locators is None:
+        locators = {}
+        axis._prettyplots_locators = locators
+
+    key = (which, spacing)
+    locator = locators.get(key)
+    if locator is None:
+        locator = MultipleLocator(spacing)
+        locators[key] = locator
+
+    return locator
+
+
+
+def _set_ticklabels(axis, labels):
+    r"""Set the major tick labels of an axis.
+
+    If all the labels are empty, then the ticks are left unlabelled using a
+    :class:`matplotlib.ticker.NullFormatter`, rather than by setting an empty 
+    label for each tick.
+
+    Parameters
+    ----------
+    axis : :class:`matplotlib.axis.Axis`
+        The axis.
+    labels : `array_like` (`str`, ndim=1)
+        The tick labels.
+
+    Returns
+    -------
+    """
+    if any(labels):
+        axis.set_ticklabels(labels)
+    else:
+        axis.set_major_formatter(mpl.ticker.NullFormatter())
+
+    return None
+
+
+
+# Keyword arguments of :meth:`matplotlib.axes.Axes.axvline` and
+# :meth:`matplotlib.axes.Axes.axhline` that can be translated to keyword
+# arguments of :meth:`matplotlib.axes.Axes.vlines` and 
+# :meth:`matplotlib.axes.Axes.hlines`.
+_ref_line_kwarg_names = {"c": "colors",
+                         "color": "colors",
+                         "colors": "colors",
+                         "ls": "linestyles",
+                         "linestyle": "linestyles",
+                         "linestyles": "linestyles",
+                         "lw": "linewidths",
+                         "linewidth": "linewidths",
+                         "linewidths": "linewidths",
+                         "alpha": "alpha",
+                         "zorder": "zorder",
+                         "label": "label"}
+
+
+
+def _add_ref_lines(ax, positions, kwargs_set, vertical):
+    r"""Add vertical or horizontal reference lines spanning an axes.
+
+    If all the lines share the same line properties, and these properties are
+    supported by :class:`matplotlib.collections.LineCollection`, then the 
+    lines are batched into a single collection. Otherwise, the lines are added
+    individually using :meth:`matplotlib.axes.Axes.axvline` or 
+    :meth:`matplotlib.axes.Axes.axhline`.
+
+    Parameters
+    ----------
+    ax : :class:`matplotlib.axes.Axes`
+        The axes to which to add the lines.
+    positions : `array_like` (`float`, ndim=1)
+        The positions of the lines along the x-axis (y-axis) if ``vertical`` 
+        is `True` (`False`).
+    kwargs_set : `array_like` (`dict`, ndim=1)
+        ``kwargs_set[i]`` specifies the line properties of the ``i`` th line.
+    vertical : `bool`
+        Specifies whether the lines are vertical or horizontal.
+
+    Returns
+    -------
+    """
+    pairs = list(zip(positions, kwargs_set))
+    if len(pairs) == 0:
+        return None
+    
+    kwargs = pairs[0][1]
+    if (all(key in _ref_line_kwarg_names for key in kwargs)
+        and all(line_kwargs == kwargs for _, line_kwargs in pairs)):
+        positions = [position for position, _ in pairs]
+        collection_kwargs = {_ref_line_kwarg_names[key]: val
+                             for key, val in kwargs.items()}
+        if vertical:
+            ax.vlines(positions, 0, 1, transform=ax.get_xaxis_transform(),
+                      **collection_kwargs)
+        else:
+            ax.hlines(positions, 0, 1, transform=ax.get_yaxis_transform(),
+                      **collection_kwargs)
+    else:
+        for position, line_kwargs in pairs:
+            if vertical:
+                ax.axvline(x=position, **line_kwargs)
+            else:
+                ax.axhline(y=position, **line_kwargs)
+
+    return None
+
+
+
+def _is_best_legend_loc(legend_loc):
+    r"""Check whether a legend location is to be determined automatically.
+
+    Matplotlib places such a legend where it overlaps the least with the lines,
+    patches, collection offsets and text artists of its axes. Artists that are
+    not drawn, e.g. empty text, are taken into account as well.
+
+    Parameters
+    ----------
+    legend_loc : `str` | `int` | array_like (`float`, shape=(2,)) | `None`
+        The legend location. If set to `None`, 
+        ``matplotlib.rcParams['legend.loc']`` is used.
+
+    Returns
+    -------
+    is_best_legend_loc : `bool`
+        `True` if ``legend_loc`` is ``'best'``, or equivalently ``0``.
+    """
+    if legend_loc is None:
+        legend_loc = mpl.rcParams['legend.loc']
+    is_best_legend_loc = (isinstance(legend_loc, (str, int))
+                          and (legend_loc in ("best", 0)))
+
+    return is_best_legend_loc
+
+
+
+# Matplotlib backends that cannot display figures.
+_non_interactive_backends = ("agg", "cairo", "pdf", "pgf", "ps", "svg",
+                             "template")
+
+
+
+def _show():
+    r"""Display all open figures, unless the backend is non-interactive.
+
+    Calling :func:`matplotlib.pyplot.show` with a non-interactive backend
+    accomplishes nothing except emitting a warning.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    """
+    if mpl.get_backend().lower() not in _non_interactive_backends:
+        plt.show()
+
+    return None
+
+
+
+# Signatures of the plotting parameters used to generate the most recent
+# figure of each plotting function, and the objects returned by the
+# corresponding function calls.
+_last_signatures = {}
+_last_results = {}
+
+
+
+# Hashable representations of the contents of data sets, see `_freeze`.
+_frozen_data_sets = weakref.WeakKeyDictionary()
+
+
+
+def _freeze(obj):
+    r"""Convert an object into a hashable representation of its contents.
+
+    Parameters
+    ----------
+    obj : any type
+        The object to be converted. Typically a plotting parameter.
+
+    Returns
+    -------
+    frozen_obj : any hashable type
+        The hashable representation. Two objects with equal contents have equal
+        representations. Normalizations and colormaps, which may be modified
+        in place, are represented by their state. Other objects that are 
+        neither containers, arrays, data sets, nor hashable are represented by
+        their identity.
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            frozen_obj = ("ndarray", obj.shape, tuple(_freeze(elem)
+                                                      for elem in obj.flat))
+        else:
+            digest = hashlib.blake2b(np.ascontiguousarray(obj)).digest()
+            mask = np.ma.getmask(obj)
+            frozen_obj = ("ndarray", obj.shape, obj.dtype.str, digest,
+                          None if mask is np.ma.nomask else _freeze(mask))
+    elif isinstance(obj, (XData, XYData)):
+        # Data sets are immutable, hence their representations are computed
+        # only once.
+        frozen_obj = _frozen_data_sets.get(obj)
+        if frozen_obj is None:
+            frozen_obj = (type(obj).__name__,
+                          tuple(_freeze(getattr(obj, attr_name))
+                                for attr_name in obj.__slots__
+                                if not attr_name.startswith("_")))
+            _frozen_data_sets[obj] = frozen_obj
+    elif isinstance(obj, mpl.colors.Normalize):
+        # The callbacks notify e.g. colorbars of changes to the normalization,
+        # and do not affect the normalization itself.
+        frozen_obj = (type(obj), _freeze({key: val
+                                          for key, val in vars(obj).items()
+                                          if key != "callbacks"}))
+    elif isinstance(obj, mpl.colors.Colormap):
+        # A colormap is represented by the colors it maps to, including those 
+        # for out-of-range and invalid values.
+        colors = np.vstack((obj(np.linspace(0, 1, obj.N)), obj.get_bad(),
+                            obj.get_over(), obj.get_under()))
+        frozen_obj = (type(obj), obj.name, obj.N, _freeze(colors))
+    elif isinstance(obj, dict):
+        frozen_obj = ("dict", tuple(sorted((str(key), _freeze(val))
+                                           for key, val in obj.items())))
+    elif isinstance(obj, (list, tuple, range)):
+        frozen_obj = tuple(_freeze(elem) for elem in obj)
+    else:
+        try:
+            hash(obj)
+            frozen_obj = obj
+        except TypeError:
+            frozen_obj = ("id", id(obj))
+
+    return frozen_obj
+
+
+
+def _reuse_last_fig(func_name, signature, params):
+    r"""Show and/or save the most recent figure if its parameters are unchanged.
+
+    Parameters
+    ----------
+    func_name : `str`
+        The name of the plotting function that generated the figure.
+    signature : `tuple` | `None`
+        The signature of the current plotting parameters, or `None` if figures
+        are not to be reused, see ``params.reuse_fig``.
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The current plotting parameters.
+
+    Returns
+    -------
+    result : `tuple` | `None`
+        If the most recent figure generated by the plotting function is still 
+        open, has not been changed since it was returned, and was generated 
+        using plotting parameters with the same signature, then ``result`` is
+        the object returned by the plotting function when it generated said
+        figure. Otherwise, or if figures are
+        not to be reused, ``result`` is `None`.
+    """
+    result = _last_results.get(func_name)
+    if ((signature is None)
+        or (result is None)
+        or (_last_signatures.get(func_name) != signature)
+        or (not _fig_is_open(result[0]))
+        or result[0].stale
+        or (params.show and (result[0] in _figs_without_pyplot))):
+        return None
+
+    _finalize(func_name, signature, result, params)
+
+    return result
+
+
+
+def _finalize(func_name, signature, result, params):
+    r"""Save and/or show a figure generated by a plotting function, and record
+    it as the most recent figure of said function.
+
+    The figure is saved before it is shown, since the latter may block until 
+    the figure is closed. Moreover, in that order the figure is drawn only 
+    once by interactive backends that draw lazily.
+
+    Parameters
+    ----------
+    func_name : `str`
+        The name of the plotting function that generated the figure.
+    signature : `tuple` | `None`
+        The signature of the plotting parameters used to generate the figure,
+        or `None` if the figure is not to be reused, in which case it is not
+        recorded.
+    result : `tuple`
+        The object returned by the plotting function, whose first element is
+        the figure.
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    """
+    if isinstance(params.filename, str):
+        _save_fig(result[0], signature, params)
+    if params.show:
+        _show()
+
+    if signature is None:
+        return None
+    _last_signatures[func_name] = signature
+    _last_results[func_name] = result
+    # Any subsequent change to the figure or its artists marks the figure as 
+    # stale again, see `_reuse_last_fig`.
+    result[0].stale = False
+
+    return None
+
+
+
+# The most recently saved contents of figures generated by the plotting
+# functions, along with the corresponding keys, see `_save_fig`.
+_saved_fig_contents = weakref.WeakKeyDictionary()
+
+
+
+def _save_fig(fig, signature, params):
+    r"""Save a figure generated by a plotting function to a file.
+
+    The file contents are kept in memory, so that if the figure is saved again
+    in the same format without its plotting parameters having changed, the 
+    figure is not rendered again. Hence changes made to the figure after it 
+    was returned by the plotting function are not saved upon calling the
+    plotting function again with the same parameters.
+
+    Parameters
+    ----------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+    signature : `tuple` | `None`
+        The signature of the plotting parameters used to generate the figure.
+        If set to `None`, the file contents are not kept in memory.
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The plotting parameters, specifying the path and format of the file.
+
+    Returns
+    -------
+    """
+    # Only some of the plotting parameter classes specify the resolution.
+    dpi = getattr(params, "dpi", None)
+    
+    if params.img_fmt is None:
+        # The format is inferred from the filename.
+        fig.savefig(params.filename, dpi=dpi)
+        return None
+    if signature is None:
+        fig.savefig(params.filename, format=params.img_fmt, dpi=dpi)
+        return None
+    
+    key = (signature, params.img_fmt, _freeze(mpl.rcParams['savefig.dpi']))
+    key_and_contents = _saved_fig_contents.get(fig)
+    if (key_and_contents is None) or (key_and_contents[0] != key):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=params.img_fmt, dpi=dpi)
+        key_and_contents = (key, buffer.getvalue())
+        _saved_fig_contents[fig] = key_and_contents
+
+    with open(params.filename, "wb") as file_obj:
+        file_obj.write(key_and_contents[1])
+
+    return None
+
+
+
+@functools.lru_cache(maxsize=32)
+def _registered_colormap(name):
+    r"""Get a registered colormap whose lookup table has been built.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the colormap.
+
+    Returns
+    -------
+    cmap : :class:`matplotlib.colors.Colormap`
+        The colormap. It is shared between calls, hence it should not be 
+        modified.
+    """
+    cmap = mpl.colormaps[name]
+    cmap(0.0)  # Calling the colormap builds its lookup table.
+
+    return cmap
+
+
+
+def _colormap(cmap):
+    r"""Resolve a colormap specification to a colormap.
+
+    Registered colormaps are only built once, and then copied, lookup table 
+    included, upon subsequent requests.
+
+    Parameters
+    ----------
+    cmap : `str` | :class:`matplotlib.colors.Colormap` | `None`
+        The name of a registered colormap, a colormap, or `None` for the 
+        default colormap ``matplotlib.rcParams['image.cmap']``.
+
+    Returns
+    -------
+    cmap : :class:`matplotlib.colors.Colormap`
+        The colormap. If ``cmap`` was specified as a colormap, then it is 
+        returned as is.
+    """
+    if cmap is None:
+        cmap = mpl.rcParams['image.cmap']
+    if isinstance(cmap, str):
+        cmap = _registered_colormap(cmap).copy()
+
+    return cmap
+
+
+
+def _prequantize(z, cmap, norm):
+    r"""Map an image to 8-bit RGBA colors.
+
+    Parameters
+    ----------
+    z : :class:`numpy.ndarray` (`float`, ndim=2)
+        The image.
+    cmap : `str` | :class:`matplotlib.colors.Colormap` | `None`
+        The colormap. If set to `None`, the default colormap is used.
+    norm : :class:`matplotlib.colors.Normalize` | `None`
+        The normalization of ``z`` to the interval ``[0, 1]``. Unspecified 
+        limits are set to the limits of the valid elements of ``z``, as done
+        by :meth:`matplotlib.axes.Axes.imshow`.
+
+    Returns
+    -------
+    rgba : :class:`numpy.ndarray` (`numpy.uint8`, shape=(``*z.shape``, 4))
+        The RGBA colors of the image.
+    mappable : :class:`matplotlib.cm.ScalarMappable`
+        The mapping from ``z`` to ``rgba``, from which the colorbar is made.
+    """
+    if norm is None:
+        norm = mpl.colors.Normalize()
+    mappable = mpl.cm.ScalarMappable(norm=norm, cmap=cmap)
+
+    z = np.ma.masked_invalid(z, copy=False)
+    norm.autoscale_None(z)
+    rgba = mappable.to_rgba(z, bytes=True)
+
+    return rgba, mappable
+
+
+
+# Size in bytes above which double precision images are converted to single
+# precision before being displayed by `single_imshow`, provided that single 
+# precision suffices, see `_float32_suffices`.
+_float32_imshow_threshold = 4 * 1024**2
+
+
+
+def _float32_suffices(z, cmap, norm):
+    r"""Check whether an image is displayed the same in single precision.
+
+    Single precision suffices if its resolution at the largest magnitude of 
+    the elements of the image is finer than one step of the colormap. Images
+    with a large offset relative to their variation, e.g. ``1e6 + 1e-3*z``,
+    would otherwise collapse to a few colors.
+
+    Parameters
+    ----------
+    z : :class:`numpy.ndarray` (`float`)
+        The image.
+    cmap : :class:`matplotlib.colors.Colormap`
+        The colormap.
+    norm : :class:`matplotlib.colors.Normalize` | `None`
+        The normalization of ``z`` to the interval ``[0, 1]``.
+
+    Returns
+    -------
+    float32_suffices : `bool`
+        `True` if single precision suffices. Always `False` for nonlinear 
+        normalizations, and for images without finite elements.
+    """
+    if (norm is not None) and (type(norm) is not mpl.colors.Normalize):
+        return False
+
+    # Unlike ``min`` and ``max``, these ignore NaNs, i.e. masked out elements.
+    z_min = np.fmin.reduce(z, axis=None)
+    z_max = np.fmax.reduce(z, axis=None)
+    if not (np.isfinite(z_min) and np.isfinite(z_max)):
+        return False
+
+    # Limits specified by the normalization take precedence over the data.
+    v_min = z_min if (norm is None) or (norm.vmin is None) else norm.vmin
+    v_max = z_max if (norm is None) or (norm.vmax is None) else norm.vmax
+    resolution = max(abs(z_min), abs(z_max)) * np.finfo(np.float32).eps
+    float32_suffices = abs(v_max - v_min) >= resolution * cmap.N
+
+    return float32_suffices
+
+
+
+# Figures generated by the plotting functions that are not managed by pyplot,
+# see `_new_fig`.
+_figs_without_pyplot = weakref.WeakSet()
+
+
+
+def _uses_pyplot(params):
+    r"""Check whether a figure is to be managed by pyplot.
+
+    Figures that are only saved to a file, i.e. not shown, are created without
+    pyplot, thus avoiding the overhead of creating a canvas for the 
+    (possibly interactive) pyplot backend. Such figures are not displayed by
+    :func:`matplotlib.pyplot.show`, nor are they closed by 
+    :func:`matplotlib.pyplot.close`.
+
+    Parameters
+    ----------
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    uses_pyplot : `bool`
+        `True` if the figure is to be managed by pyplot.
+    """
+    uses_pyplot = params.show or (not isinstance(params.filename, str))
+
+    return uses_pyplot
+
+
+
+def _new_fig(params):
+    r"""Create a new figure, managed by pyplot only if necessary.
+
+    The figure is created with its final size, i.e. the default figure size
+    multiplied by ``params.scale``, so that it need not be resized later.
+
+    Parameters
+    ----------
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The plotting parameters, see `_uses_pyplot`.
+
+    Returns
+    -------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+    """
+    fig_dims = mpl.rcParams['figure.figsize']
+    figsize = (fig_dims[0]*params.scale, fig_dims[1]*params.scale)
+    
+    if _uses_pyplot(params):
+        fig = plt.figure(figsize=figsize)
+    else:
+        # Only needed here, see the comment above `_lazy_import`.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _figs_without_pyplot.add(fig)
+
+    return fig
+
+
+
+def _fig_is_open(fig):
+    r"""Check whether a figure generated by a plotting function is still open.
+
+    Parameters
+    ----------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+
+    Returns
+    -------
+    fig_is_open : `bool`
+        `True` unless the figure is managed by pyplot and has been closed.
+    """
+    # Pyplot reuses the numbers of closed figures, hence the figure manager
+    # registered under ``fig.number`` is checked to be that of ``fig``.
+    manager = fig.canvas.manager
+    fig_is_open = ((fig in _figs_without_pyplot)
+                   or ((manager is not None)
+                       and (plt._pylab_helpers.Gcf.get_fig_manager(fig.number)
+                            is manager)))
+
+    return fig_is_open
+
+
+
+# Figures and axes that are cleared and reused by the plotting functions upon
+# subsequent calls, keyed by the names of the plotting functions and the
+# parameters that affect the layout of the figures, in order of last use.
+_fig_cache = collections.OrderedDict()
+
+# Maximum number of figures in the cache. Figures that are dropped from the
+# cache are left open.
+_max_num_cached_figs = 8
+
+
+
+def _layout_key(params):
+    r"""Hashable representation of the parameters affecting the figure layout.
+
+    Parameters
+    ----------
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    key : `tuple`
+        The hashable representation, consisting of the aspect ratio, the scale,
+        the default figure size, whether ``tight_layout`` is applied and, for 
+        :class:`SingleImshowParams`, the colorbar axes positioning.
+    """
+    key = (params.aspect, params.scale, mpl.rcParams['figure.figsize'],
+           params.tight_layout, getattr(params, "append_axes_kwargs", None))
+    key = _freeze(key)
+
+    return key
+
+
+
+def _reuse_cached_fig(func_name, key):
+    r"""Clear and return a cached figure and its axes.
+
+    Parameters
+    ----------
+    func_name : `str`
+        The name of the plotting function that cached the figure and axes.
+    key : `tuple`
+        A hashable representation of the plotting parameters that affect the
+        layout of the figure, see `_layout_key`.
+
+    Returns
+    -------
+    fig : :class:`matplotlib.figure.Figure` | `None`
+        The cached figure, or `None` if there is no cached figure that is still
+        open and was created using the same layout parameters.
+    axes : `tuple` (:class:`matplotlib.axes.Axes`) | `None`
+        The cleared cached axes, or `None` if ``fig`` is `None`.
+    """
+    fig, axes = _fig_cache.get((func_name, key), (None, None))
+    if fig is None:
+        return None, None
+    if not _fig_is_open(fig):
+        del _fig_cache[(func_name, key)]
+        return None, None
+
+    _fig_cache.move_to_end((func_name, key))
+    if fig not in _figs_without_pyplot:
+        plt.figure(fig.number)  # Make ``fig`` the current figure.
+    for ax in axes:
+        ax.cla()
+
+    return fig, axes
+
+
+
+def _cache_fig(func_name, key, fig, axes):
+    r"""Cache a figure and its axes for reuse.
+
+    If the cache is full, the least recently used figure is dropped from it.
+
+    Parameters
+    ----------
+    func_name : `str`
+        The name of the plotting function that created the figure and axes.
+    key : `tuple`
+        A hashable representation of the plotting parameters that affect the
+        layout of the figure, see `_layout_key`.
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+    axes : `tuple` (:class:`matplotlib.axes.Axes`)
+        The axes of the figure.
+
+    Returns
+    -------
+    """
+    _fig_cache[(func_name, key)] = (fig, axes)
+    _fig_cache.move_to_end((func_name, key))
+    while len(_fig_cache) > _max_num_cached_figs:
+        _fig_cache.popitem(last=False)
+
+    return None
+
 
 
+# Signatures of the layouts of figures at the time ``tight_layout`` was last
+# applied to them.
+_layout_signatures = weakref.WeakKeyDictionary()
 
-# XY data class.
-from prettyplots.data import XYData
 
 
+def _tight_layout(fig, axes, params):
+    r"""Apply ``tight_layout`` to a figure, unless its layout is unchanged.
 
-############################
-## Authorship information ##
-############################
+    The layout of a figure is considered unchanged if the figure was reused, 
+    and the figure size, the axis limits, and all plotting parameters apart 
+    from the data are the same as when ``tight_layout`` was last applied. 
+    Nothing is done if ``params.tight_layout`` is `False`.
 
-__author__     = "Matthew Fitzpatrick"
-__copyright__  = "Copyright 2020"
-__credits__    = ["Matthew Fitzpatrick"]
-__maintainer__ = "Matthew Fitzpatrick"
-__email__      = "mfitzpatrick@dwavesys.com"
-__status__     = "Development"
+    Parameters
+    ----------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+    axes : `tuple` (:class:`matplotlib.axes.Axes`)
+        The axes of the figure.
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    """
+    if not params.tight_layout:
+        return None
+    
+    layout_signature = (params._signature(include_data=False),
+                        tuple(fig.get_size_inches()),
+                        tuple((ax.get_xlim(), ax.get_ylim()) for ax in axes))
+    if _layout_signatures.get(fig) != layout_signature:
+        fig.tight_layout(pad=1.08)
+        _layout_signatures[fig] = layout_signature
 
+    return None
 
 
-##################################
-## Define classes and functions ##
-##################################
 
-# List of public objects in objects.
-__all__ = ["SinglePlotParams",
-           "single_plot",
-           "SingleImshowParams",
-           "single_imshow",
-           "SingleHistParams",
-           "single_hist"]
+def _contains_tex_markup(obj):
+    r"""Check whether a string, or any string in a nested sequence, contains 
+    TeX markup.
+
+    Parameters
+    ----------
+    obj : `str` | array_like | `None`
+        The string(s). Non-string objects are ignored.
+
+    Returns
+    -------
+    contains_tex_markup : `bool`
+        `True` if any of the strings contain a dollar sign or a backslash.
+    """
+    if isinstance(obj, str):
+        contains_tex_markup = ("$" in obj) or ("\\" in obj)
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        contains_tex_markup = any(_contains_tex_markup(item) for item in obj)
+    else:
+        contains_tex_markup = False
+
+    return contains_tex_markup
+
+
+
+def _set_usetex(params):
+    r"""Set whether text is rendered using LaTeX, according to 
+    ``params.use_tex``.
+
+    Text artists take on the value of the ``text.usetex`` rc parameter upon 
+    creation, hence it is set globally rather than temporarily. If 
+    ``params.use_tex`` is `None`, the rc parameter is never set to `False`.
+
+    Parameters
+    ----------
+    params : :class:`SinglePlotParams` | :class:`SingleImshowParams` | :class:`SingleHistParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    """
+    use_tex = params.use_tex
+    if use_tex is None:
+        # LaTeX is only turned on, so as not to override a user who has enabled
+        # it globally.
+        use_tex = (mpl.rcParams['text.usetex']
+                   or any(_contains_tex_markup(getattr(params, key))
+                          for key in params._text_keys))
+    if mpl.rcParams['text.usetex'] != use_tex:
+        mpl.rcParams['text.usetex'] = use_tex
+
+    return None
+
 
 
+def close():
+    r"""Close the figures cached for reuse by the plotting functions.
 
-def _to_np_array(c):
-    r"""Convert object to a numpy array (if it is not already of that type).
+    Subsequent calls to the plotting functions create new figures.
 
     Parameters
     ----------
-    c : `float` | array_like
-        The object to be converted (typically a scalar e.g. float).
 
     Returns
     -------
-    c_array : :class:`numpy.ndarray`
-        The object as a numpy array.
     """
-    c_array = np.array(c)
-    if c_array.shape == ():
-        c_array = c_array.reshape([1])
+    _lazy_import()
+
+    for fig, _ in _fig_cache.values():
+        plt.close(fig)
+    _fig_cache.clear()
+    _last_signatures.clear()
+    _last_results.clear()
+
+    return None
+
 
-    return c_array
 
 
 
@@ -227,19 +1536,70 @@ class SinglePlotParams():
     img_fmt : `str`, optional
         Image format.
     show : `bool`, optional
-        If set to `True`, show the plot, otherwise do not show the plot.
+        If set to `True`, show the plot, otherwise do not show the plot. The
+        plot is never shown if the matplotlib backend is non-interactive, e.g.
+        ``'agg'``. If set to `False` and ``filename`` is specified, the figure
+        is created without :mod:`matplotlib.pyplot`, hence it is not shown by
+        later calls to :func:`matplotlib.pyplot.show` either.
+    tight_layout : `bool`, optional
+        If set to `True`, :meth:`matplotlib.figure.Figure.tight_layout` is 
+        applied to the figure. Since this requires measuring all text in the
+        figure, it can be worthwhile to disable it when generating many 
+        figures whose layout is adjusted afterwards anyway, e.g. by calling
+        :func:`matplotlib.pyplot.tight_layout` once at the end of a script.
+    reuse_fig : `bool`, optional
+        If set to `False`, a new figure is created, which is not reused by 
+        subsequent calls either. If set to `True`, a figure previously 
+        generated by :func:`single_plot` with the same layout, e.g. the same 
+        ``aspect`` and ``scale``, is cleared and redrawn rather than a new 
+        figure being created, provided that said figure is still open and was
+        also generated with ``reuse_fig`` set to `True`. The figure and axes
+        returned by the previous call are then the same objects as those 
+        returned by the current call, hence they no longer display what they
+        displayed before. This saves the cost of creating figures when e.g.
+        many figures are saved to files in a loop.
+    use_tex : `bool` | `None`, optional
+        If set to `True`, text is rendered using LaTeX. If set to `False`,
+        matplotlib's built-in mathtext is used instead, which is considerably
+        faster since no LaTeX processes need to be spawned. If set to `None`,
+        LaTeX is used if ``matplotlib.rcParams['text.usetex']`` is already 
+        `True`, or if any of the labels or titles contain TeX markup, i.e. a 
+        dollar sign or a backslash, in which case said rc parameter is set to
+        `True`.
 
     Attributes
     ----------
     Same as parameters.
     """
+    # Attributes are stored in slots rather than in a per-instance dictionary.
+    __slots__ = ("xy_data_sets", "scatterplot", "colors", "markers",
+                 "markersize", "vlines", "hlines", "vline_kwargs_set",
+                 "hline_kwargs_set", "linestyles", "linewidth",
+                 "grid_linewidth", "x_lims", "y_lims", "x_log_scale",
+                 "y_log_scale", "x_label", "y_label", "xy_label_ft_size",
+                 "legend_labels", "legend_loc", "legend_ft_size",
+                 "major_xtick_len", "minor_xtick_len", "major_ytick_len",
+                 "minor_ytick_len", "major_xtick_spacing",
+                 "minor_xtick_spacing", "major_ytick_spacing",
+                 "minor_ytick_spacing", "tick_label_ft_size", "title",
+                 "title_ft_size", "fig_label", "fig_label_coords",
+                 "fig_label_ft_size", "aspect", "scale", "filename", "img_fmt",
+                 "show", "tight_layout", "reuse_fig", "use_tex", "_X", "_Y",
+                 "_cache")
+
+    # Names of the attributes storing the data to be plotted.
+    _data_keys = ("xy_data_sets", "_X", "_Y")
+
+    # Names of the attributes storing text that may contain TeX markup.
+    _text_keys = ("x_label", "y_label", "legend_labels", "title", "fig_label")
+    
     def __init__(self,
                  xy_data_sets,
                  scatterplot=False, colors=None, markers=None, markersize=11,
-                 vlines=[], hlines=[],
+                 vlines=(), hlines=(),
                  vline_kwargs_set=None, hline_kwargs_set=None,
                  linestyles=None, linewidth=3, grid_linewidth=0,
-                 x_lims=[None, None], y_lims=[None, None],
+                 x_lims=(None, None), y_lims=(None, None),
                  x_log_scale=False, y_log_scale=False,
                  x_label='', y_label='', xy_label_ft_size=20,
                  legend_labels=None, legend_loc='best', legend_ft_size=18,
@@ -249,10 +1609,11 @@ class SinglePlotParams():
                  major_ytick_spacing=None, minor_ytick_spacing=None,
                  tick_label_ft_size=18,
                  title='', title_ft_size=20,
-                 fig_label='', fig_label_coords=[0.05, 0.93],
+                 fig_label='', fig_label_coords=(0.05, 0.93),
                  fig_label_ft_size=20,
                  aspect='auto', scale=1,
-                 filename=None, img_fmt='pdf', show=True):
+                 filename=None, img_fmt='pdf', show=True, tight_layout=True,
+                 reuse_fig=False, use_tex=None):
         self.xy_data_sets = xy_data_sets
 
         self.scatterplot = scatterplot
@@ -305,104 +1666,246 @@ class SinglePlotParams():
         self.filename = filename
         self.img_fmt = img_fmt
         self.show = show
+        self.tight_layout = tight_layout
+        self.reuse_fig = reuse_fig
+        self.use_tex = use_tex
+
+        # Stacked data arrays, set by :meth:`SinglePlotParams.from_arrays`.
+        self._X = None
+        self._Y = None
+
+        # Signature and result of the most recent call to 
+        # :meth:`SinglePlotParams._left_right_params`.
+        self._cache = None
         
         return None
 
 
 
-def single_plot(params):
-    r"""Generate and a single plot based on the parameters ``params``.
+    @classmethod
+    def from_arrays(cls, X, Y, **kwargs):
+        r"""Construct plotting parameters from stacked data arrays.
+
+        Rather than storing a sequence of :class:`prettyplots.XYData` objects,
+        the x and y data of all xy data sets are stored as two arrays, which
+        :func:`single_plot` passes directly to matplotlib. All xy data sets are
+        plotted with respect to the left y-scale, and without error bars.
+
+        Parameters
+        ----------
+        X : `array_like` (`float`, ndim=1) | `array_like` (`float`, ndim=2) | `array_like` (`array_like` (`float`, ndim=1), ndim=1)
+            The x data. If ``X`` is of the type `array_like` (`float`, ndim=1),
+            then it is shared by all xy data sets. Otherwise, ``X[i]`` is
+            the x data of the ``i`` th xy data set.
+        Y : `array_like` (`float`, ndim=1) | `array_like` (`float`, ndim=2) | `array_like` (`array_like` (`float`, ndim=1), ndim=1)
+            The y data. If ``Y`` is of the type `array_like` (`float`, ndim=1),
+            then there is a single xy data set. Otherwise, ``Y[i]`` is the y
+            data of the ``i`` th xy data set. The xy data sets may have 
+            different numbers of points, in which case ``X`` and ``Y`` are 
+            sequences of 1D arrays.
+        **kwargs
+            The remaining parameters of :class:`SinglePlotParams`, except for
+            ``xy_data_sets``.
+
+        Returns
+        -------
+        params : :class:`SinglePlotParams`
+            The plotting parameters.
+        """
+        try:
+            Y = np.asarray(Y)
+        except ValueError:
+            # Xy data sets with different numbers of points.
+            Y = [np.asarray(y) for y in Y]
+            X = [np.asarray(x) for x in X]
+        else:
+            if Y.ndim == 1:
+                Y = Y[np.newaxis, :]
+            X = np.asarray(X)
+            if X.ndim == 1:
+                if X.shape[-1] != Y.shape[-1]:
+                    raise ValueError("The shared x data must contain {} "
+                                     "points, one for each point of the y "
+                                     "data sets.".format(Y.shape[-1]))
+                X = np.broadcast_to(X, Y.shape)
+
+        if len(X) != len(Y):
+            raise ValueError("`X` and `Y` must contain the same number of "
+                             "xy data sets.")
+        if ((np.shape(X) != np.shape(Y)) if isinstance(Y, np.ndarray)
+            else any(np.shape(x) != np.shape(y) for x, y in zip(X, Y))):
+            raise ValueError("The x and y data of each xy data set must "
+                             "contain the same number of points.")
+
+        params = cls([], **kwargs)
+        params.xy_data_sets = None
+        params._X = X
+        params._Y = Y
+        
+        return params
+
+
+
+    def _signature(self, include_data=True):
+        r"""Signature of the parameters that affect the generated figure.
+
+        Parameters
+        ----------
+        include_data : `bool`, optional
+            If set to `False`, the data to be plotted is excluded from the 
+            signature.
+
+        Returns
+        -------
+        signature : `tuple`
+            A hashable representation of all parameters except ``filename``,
+            ``img_fmt``, ``show``, and ``reuse_fig``. Two sets of parameters 
+            with equal signatures generate identical figures.
+        """
+        excluded_keys = ("filename", "img_fmt", "show", "reuse_fig", "_cache")
+        if not include_data:
+            excluded_keys += self._data_keys
+        signature = _freeze({key: getattr(self, key) for key in self.__slots__
+                             if key not in excluded_keys})
+
+        return signature
+
+
+
+    def _left_right_params(self, signature):
+        r"""Split the parameters into their left and right y-scale parts.
+
+        The result is cached, and is only recalculated if the signature of the
+        parameters has changed since the previous call.
+
+        Parameters
+        ----------
+        signature : `tuple` | `None`
+            The signature of the parameters, as returned by 
+            :meth:`SinglePlotParams._signature`. If set to `None`, the result
+            is recalculated, and not cached.
+
+        Returns
+        -------
+        no_legend : `bool`
+            Specifies whether the legend is to be omitted.
+        left_params : `dict`
+            The parameters of the left y-scale, see 
+            `_split_single_plot_params`.
+        right_params : `dict`
+            The parameters of the right y-scale.
+        """
+        if signature is None:
+            return _split_single_plot_params(self)
+        if (self._cache is None) or (self._cache[0] != signature):
+            self._cache = (signature, _split_single_plot_params(self))
+
+        return self._cache[1]
+
+
+
+def _split_left_right(param, num_left, num_right, scalar_types=(str,)):
+    r"""Split a per-xy-data-set plotting parameter into its left and right 
+    y-scale parts.
 
     Parameters
-    -----------
-    params : :class:`SinglePlotParams`
-        The plotting parameters.
+    ----------
+    param : `None` | scalar | `array_like`
+        The plotting parameter, e.g. :attr:`SinglePlotParams.colors`. If 
+        ``param`` is `None` or a scalar, then it applies to every xy data set.
+        If ``param`` is a flat sequence, i.e. its first element is `None` or a
+        scalar, then it applies to the xy data sets plotted with respect to 
+        the left y-scale only. Otherwise, ``param[0]`` and ``param[1]`` apply 
+        to the xy data sets plotted with respect to the left and right 
+        y-scales respectively.
+    num_left : `int`
+        The number of xy data sets plotted with respect to the left y-scale.
+    num_right : `int`
+        The number of xy data sets plotted with respect to the right y-scale.
+    scalar_types : `tuple` (`type`), optional
+        The types of scalar values of ``param``.
 
     Returns
     -------
-
+    left_param : `array_like`
+        The values of ``param`` for the xy data sets plotted with respect to 
+        the left y-scale.
+    right_param : `array_like`
+        The values of ``param`` for the xy data sets plotted with respect to 
+        the right y-scale.
     """
-    mpl.rcParams['text.usetex'] = True
+    if (param is None) or isinstance(param, scalar_types):
+        left_param = [param] * num_left
+        right_param = [param] * num_right
+    elif (param[0] is None) or isinstance(param[0], scalar_types):
+        left_param = param
+        right_param = []
+    else:
+        left_param = param[0]
+        right_param = param[1]
 
-    fig = plt.figure()
-    ax_1 = fig.add_subplot(111)
-    ax_2 = ax_1.twinx()
+    return left_param, right_param
 
 
 
-    xy_data_sets = params.xy_data_sets
-    try:
-        num_left_xy_data_sets = len(xy_data_sets[0])
-        num_right_xy_data_sets = len(xy_data_sets[1])
-        left_xy_data_sets = xy_data_sets[0]
-        right_xy_data_sets = xy_data_sets[1]
-    except TypeError as e:
-        num_left_xy_data_sets = len(xy_data_sets)
-        num_right_xy_data_sets = 0
-        left_xy_data_sets = xy_data_sets
-        right_xy_data_sets = []
-    num_xy_data_sets = num_left_xy_data_sets + num_right_xy_data_sets
-        
-    legend_labels = params.legend_labels
-    if legend_labels == None:
-        no_legend = True
-        left_legend_labels = [None] * num_left_xy_data_sets
-        right_legend_labels = [None] * num_right_xy_data_sets
-    else:
-        no_legend = False
-        if isinstance(legend_labels[0], str):
-            left_legend_labels = legend_labels
-            right_legend_labels = []
-        else:
-            left_legend_labels = legend_labels[0]
-            right_legend_labels = legend_labels[1]
+def _split_single_plot_params(params):
+    r"""Split the parameters of :func:`single_plot` into their left and right
+    y-scale parts.
 
-    colors = params.colors
-    if colors == None:
-        left_colors = [None] * num_left_xy_data_sets
-        right_colors = [None] * num_right_xy_data_sets
-    else:
-        if isinstance(colors, str):
-            left_colors = [colors] * num_left_xy_data_sets
-            right_colors = [colors] * num_right_xy_data_sets
-        elif isinstance(colors[0], str):
-            left_colors = colors
-            right_colors = []
-        else:
-            left_colors = colors[0]
-            right_colors = colors[1]
-
-    markersize = params.markersize        
-    markers = params.markers        
-    if markers == None:
-        left_markers = [None] * num_left_xy_data_sets
-        right_markers = [None] * num_right_xy_data_sets
-    else:
-        if isinstance(markers, str):
-            left_markers = [markers] * num_left_xy_data_sets
-            right_markers = [markers] * num_right_xy_data_sets
-        elif isinstance(markers[0], str):
-            left_markers = markers
-            right_markers = []
-        else:
-            left_markers = markers[0]
-            right_markers = markers[1]
+    Parameters
+    ----------
+    params : :class:`SinglePlotParams`
+        The plotting parameters.
 
-    linewidth = params.linewidth
-    linestyles = params.linestyles        
-    if linestyles == None:
-        left_linestyles = [None] * num_left_xy_data_sets
-        right_linestyles = [None] * num_right_xy_data_sets
+    Returns
+    -------
+    no_legend : `bool`
+        Specifies whether the legend is to be omitted.
+    left_params : `dict`
+        The parameters of the xy data sets and the y-axis of the left y-scale,
+        keyed by ``"xy_data"`` (see `_unpack_xy_data_sets`), 
+        ``"legend_labels"``, ``"colors"``, ``"markers"``, ``"linestyles"``, 
+        ``"scatterplot"``, ``"y_log_scale"``, ``"y_label"``, ``"y_lims"``, 
+        ``"major_ytick_spacing"``, and ``"minor_ytick_spacing"``.
+    right_params : `dict`
+        The same as ``left_params``, except for the right y-scale.
+    """
+    xy_data_sets = params.xy_data_sets
+    if params._Y is not None:
+        # Stacked data arrays, see :meth:`SinglePlotParams.from_arrays`.
+        num_left_xy_data_sets = len(params._Y)
+        num_right_xy_data_sets = 0
+        left_xy_data = (params._X, params._Y,
+                        [None] * num_left_xy_data_sets,
+                        [None] * num_left_xy_data_sets)
+        right_xy_data = ([], [], [], [])
     else:
-        if isinstance(linestyles, str):
-            left_linestyles = [linestyles] * num_left_xy_data_sets
-            right_linestyles = [linestyles] * num_right_xy_data_sets
-        elif isinstance(linestyles[0], str):
-            left_linestyles = linestyles
-            right_linestyles = []
+        if isinstance(xy_data_sets[0], XYData):
+            left_xy_data_sets = xy_data_sets
+            right_xy_data_sets = []
         else:
-            left_linestyles = linestyles[0]
-            right_linestyles = linestyles[1]
+            left_xy_data_sets = xy_data_sets[0]
+            right_xy_data_sets = xy_data_sets[1]
+        num_left_xy_data_sets = len(left_xy_data_sets)
+        num_right_xy_data_sets = len(right_xy_data_sets)
+        left_xy_data = _unpack_xy_data_sets(left_xy_data_sets)
+        right_xy_data = _unpack_xy_data_sets(right_xy_data_sets)
+
+    no_legend = params.legend_labels is None
+    left_legend_labels, right_legend_labels = \
+        _split_left_right(params.legend_labels,
+                          num_left_xy_data_sets,
+                          num_right_xy_data_sets)
+    left_colors, right_colors = _split_left_right(params.colors,
+                                                  num_left_xy_data_sets,
+                                                  num_right_xy_data_sets)
+    left_markers, right_markers = _split_left_right(params.markers,
+                                                    num_left_xy_data_sets,
+                                                    num_right_xy_data_sets)
+    left_linestyles, right_linestyles = \
+        _split_left_right(params.linestyles,
+                          num_left_xy_data_sets,
+                          num_right_xy_data_sets)
 
     scatterplot = params.scatterplot
     if isinstance(scatterplot, bool):
@@ -429,99 +1932,162 @@ def single_plot(params):
         right_y_label = y_label[1]
 
     y_lims = params.y_lims
-    try:
-        y_lims[0][0]
+    if isinstance(y_lims[0], (list, tuple, np.ndarray)):
         left_y_lims = y_lims[0]
         right_y_lims = y_lims[1]
-    except TypeError as e:
+    else:
         left_y_lims = y_lims
         right_y_lims = y_lims
 
     major_ytick_spacing = params.major_ytick_spacing
-    if major_ytick_spacing == None:
-        left_major_ytick_spacing = None
-        right_major_ytick_spacing = None
+    if np.ndim(major_ytick_spacing) == 0:
+        left_major_ytick_spacing = major_ytick_spacing
+        right_major_ytick_spacing = major_ytick_spacing
     else:
-        try:
-            major_ytick_spacing[0][0]
-            left_major_ytick_spacing = major_ytick_spacing[0]
-            right_major_ytick_spacing = major_ytick_spacing[1]
-        except TypeError as e:
-            left_major_ytick_spacing = major_ytick_spacing
-            right_major_ytick_spacing = major_ytick_spacing
+        left_major_ytick_spacing = major_ytick_spacing[0]
+        right_major_ytick_spacing = major_ytick_spacing[1]
 
     minor_ytick_spacing = params.minor_ytick_spacing
-    if minor_ytick_spacing == None:
-        left_minor_ytick_spacing = None
-        right_minor_ytick_spacing = None
+    if np.ndim(minor_ytick_spacing) == 0:
+        left_minor_ytick_spacing = minor_ytick_spacing
+        right_minor_ytick_spacing = minor_ytick_spacing
     else:
-        try:
-            minor_ytick_spacing[0][0]
-            left_minor_ytick_spacing = minor_ytick_spacing[0]
-            right_minor_ytick_spacing = minor_ytick_spacing[1]
-        except TypeError as e:
-            left_minor_ytick_spacing = minor_ytick_spacing
-            right_minor_ytick_spacing = minor_ytick_spacing
+        left_minor_ytick_spacing = minor_ytick_spacing[0]
+        right_minor_ytick_spacing = minor_ytick_spacing[1]
+
+    left_params = {"xy_data": left_xy_data,
+                   "legend_labels": left_legend_labels,
+                   "colors": left_colors,
+                   "markers": left_markers,
+                   "linestyles": left_linestyles,
+                   "scatterplot": left_scatterplot,
+                   "y_log_scale": left_y_log_scale,
+                   "y_label": left_y_label,
+                   "y_lims": left_y_lims,
+                   "major_ytick_spacing": left_major_ytick_spacing,
+                   "minor_ytick_spacing": left_minor_ytick_spacing}
+    right_params = {"xy_data": right_xy_data,
+                    "legend_labels": right_legend_labels,
+                    "colors": right_colors,
+                    "markers": right_markers,
+                    "linestyles": right_linestyles,
+                    "scatterplot": right_scatterplot,
+                    "y_log_scale": right_y_log_scale,
+                    "y_label": right_y_label,
+                    "y_lims": right_y_lims,
+                    "major_ytick_spacing": right_major_ytick_spacing,
+                    "minor_ytick_spacing": right_minor_ytick_spacing}
+
+    return no_legend, left_params, right_params
 
 
 
-    plot_handles = []
-    for idx in range(num_left_xy_data_sets):
-        x = left_xy_data_sets[idx].x
-        y = left_xy_data_sets[idx].y
-
-        xerr = left_xy_data_sets[idx].xerr
-        yerr = left_xy_data_sets[idx].yerr
-
-        if left_scatterplot:
-            plot_handles.append(ax_1.errorbar(x, y, xerr=xerr, yerr=yerr,
-                                              marker=left_markers[idx],
-                                              c=left_colors[idx],
-                                              markersize=markersize,
-                                              label=left_legend_labels[idx],
-                                              ls='none'))
-        else:
-            plot_handles.append(ax_1.errorbar(x, y, xerr=xerr, yerr=yerr,
-                                              ls=left_linestyles[idx],
-                                              c=left_colors[idx], lw=linewidth,
-                                              label=left_legend_labels[idx],
-                                              marker=left_markers[idx],
-                                              markersize=markersize))
-
-    for idx in range(num_right_xy_data_sets):
-        x = right_xy_data_sets[idx].x
-        y = right_xy_data_sets[idx].y
-
-        xerr = right_xy_data_sets[idx].xerr
-        yerr = right_xy_data_sets[idx].yerr
-
-        if right_scatterplot:
-            plot_handles.append(ax_2.errorbar(x, y, xerr=xerr, yerr=yerr,
-                                              marker=right_markers[idx],
-                                              c=right_colors[idx],
-                                              markersize=markersize,
-                                              label=right_legend_labels[idx],
-                                              ls='none'))
-        else:
-            plot_handles.append(ax_2.errorbar(x, y, xerr=xerr, yerr=yerr,
-                                              ls=right_linestyles[idx],
-                                              c=right_colors[idx], lw=linewidth,
-                                              label=right_legend_labels[idx],
-                                              marker=right_markers[idx],
-                                              markersize=markersize))
+def single_plot(params):
+    r"""Generate and a single plot based on the parameters ``params``.
+
+    If ``params.reuse_fig`` is `True`, and the most recent figure generated by
+    this function is still open, has not been changed since, and was 
+    generated using parameters with the same signature as ``params``, then 
+    the objects returned upon generating said figure are returned again 
+    rather than a new figure being generated.
+
+    Parameters
+    -----------
+    params : :class:`SinglePlotParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    fig : :class:`matplotlib.figure.Figure`
+        The figure. If ``params.reuse_fig`` is `True`, the figure and axes may
+        be those returned by a previous call, which are then cleared and 
+        redrawn, see :class:`SinglePlotParams`.
+    ax_1 : :class:`matplotlib.axes.Axes`
+        The axes of the xy data sets plotted with respect to the left y-scale.
+    ax_2 : :class:`matplotlib.axes.Axes` | `None`
+        The axes of the xy data sets plotted with respect to the right y-scale,
+        or `None` if there are no such xy data sets, in which case no twin 
+        axes are created. The data of the xy data sets plotted on either axes 
+        can be updated using :func:`update_single_plot`.
+    """
+    _lazy_import()
+
+    # Computing the signature requires hashing the data, hence it is only
+    # computed if the figure may be reused.
+    signature = params._signature() if params.reuse_fig else None
+    result = _reuse_last_fig("single_plot", signature, params)
+    if result is not None:
+        return result
+    
+    _set_usetex(params)
+
+    no_legend, left_params, right_params = \
+        params._left_right_params(signature)
+    markersize = params.markersize
+    linewidth = params.linewidth
 
+    # Twin axes are only created if there are xy data sets to be plotted with
+    # respect to the right y-scale.
+    _, right_ys, _, _ = right_params["xy_data"]
+    has_twin = len(right_ys) > 0
+
+    fig_key = _layout_key(params) + (has_twin, _uses_pyplot(params))
+    fig, axes = ((None, None) if not params.reuse_fig
+                 else _reuse_cached_fig("single_plot", fig_key))
+    if fig is None:
+        fig = _new_fig(params)
+        ax_1 = fig.add_subplot(111)
+        axes = (ax_1, ax_1.twinx()) if has_twin else (ax_1,)
+        if params.reuse_fig:
+            _cache_fig("single_plot", fig_key, fig, axes)
+    elif has_twin:
+        # Clearing the twin axes undoes the setup performed by ``twinx``.
+        ax_1, ax_2 = axes
+        ax_2.yaxis.tick_right()
+        ax_2.yaxis.set_label_position('right')
+        ax_2.yaxis.set_offset_position('right')
+        ax_2.xaxis.set_visible(False)
+        ax_2.patch.set_visible(False)
+        ax_1.yaxis.tick_left()
+    ax_1 = axes[0]
+    ax_2 = axes[1] if has_twin else None
+
+    # Pairs of axes and the parameters of their y-scales.
+    ax_params_pairs = ((ax_1, left_params),)
+    if has_twin:
+        ax_params_pairs += ((ax_2, right_params),)
+
+
+
+    # The legend is placed with respect to the data of ``ax_1`` only.
+    best_legend_loc = ((not no_legend)
+                       and _is_best_legend_loc(params.legend_loc))
+
+    plot_handles = []
+    for ax, side_params in ax_params_pairs:
+        batch_curves = (ax is not ax_1) or (not best_legend_loc)
+        plot_handles += _plot_xy_data_sets(ax,
+                                           *side_params["xy_data"],
+                                           side_params["scatterplot"],
+                                           side_params["colors"],
+                                           side_params["markers"],
+                                           side_params["linestyles"],
+                                           side_params["legend_labels"],
+                                           linewidth,
+                                           markersize,
+                                           batch_curves)
 
 
-    if params.vline_kwargs_set == None:
-        params.vline_kwargs_set = [{}]*len(params.vlines)
-    if params.hline_kwargs_set == None:
-        params.hline_kwargs_set = [{}]*len(params.hlines)
 
-    for vline, vline_kwargs in zip(params.vlines, params.vline_kwargs_set):
-        ax_1.axvline(x=vline, **vline_kwargs)
+    vline_kwargs_set = params.vline_kwargs_set
+    if vline_kwargs_set is None:
+        vline_kwargs_set = [{}]*len(params.vlines)
+    hline_kwargs_set = params.hline_kwargs_set
+    if hline_kwargs_set is None:
+        hline_kwargs_set = [{}]*len(params.hlines)
 
-    for hline, hline_kwargs in zip(params.hlines, params.hline_kwargs_set):
-        ax_1.axhline(x=hline, **hline_kwargs)
+    _add_ref_lines(ax_1, params.vlines, vline_kwargs_set, vertical=True)
+    _add_ref_lines(ax_1, params.hlines, hline_kwargs_set, vertical=False)
 
 
             
@@ -531,7 +2097,6 @@ def single_plot(params):
         pass
     else:
         ax_1.legend(handles=plot_handles,
-                    labels=[handle.get_label() for handle in plot_handles],
                     loc=legend_loc, frameon=True, fontsize=legend_ft_size)
 
 
@@ -542,41 +2107,55 @@ def single_plot(params):
 
 
     
+    # An empty figure label is not drawn anyways, hence no artist is needed,
+    # unless the legend is placed so as to avoid it.
     fig_label = params.fig_label
-    fig_label_coords = params.fig_label_coords
-    fig_label_ft_size = params.fig_label_ft_size
-    ax_1.text(fig_label_coords[0], fig_label_coords[1], fig_label,
-              fontsize=fig_label_ft_size, horizontalalignment='center',
-              verticalalignment='center', transform=ax_1.transAxes)
+    if fig_label or best_legend_loc:
+        fig_label_coords = params.fig_label_coords
+        fig_label_ft_size = params.fig_label_ft_size
+        ax_1.text(fig_label_coords[0], fig_label_coords[1], fig_label,
+                  fontsize=fig_label_ft_size, horizontalalignment='center',
+                  verticalalignment='center', transform=ax_1.transAxes)
 
 
 
     x_label = params.x_label
     y_label = params.y_label
     xy_label_ft_size = params.xy_label_ft_size
-    ax_1.set_xlabel(x_label, fontsize=xy_label_ft_size)
-    ax_1.set_ylabel(left_y_label, fontsize=xy_label_ft_size)
-    ax_2.set_ylabel(right_y_label,
-                    fontsize=xy_label_ft_size,
-                    rotation=270, labelpad=25)
-
-
-
-    if params.x_log_scale == True:
-        ax_1.set_xscale('log')
-    if left_y_log_scale == True:
-        ax_1.set_yscale('log')
-    if right_y_log_scale == True:
-        ax_2.set_yscale('log')
-    
     x_lims = params.x_lims
-    ax_1.set_xlim(x_lims[0], x_lims[1])
-    ax_1.set_ylim(left_y_lims[0], left_y_lims[1])
-    ax_2.set_ylim(right_y_lims[0], right_y_lims[1])
+    aspect = params.aspect
+
+    # Each axes is configured by a single call to
+    # :meth:`matplotlib.axes.Axes.set`, skipping unspecified properties. Scales
+    # must be set before the limits.
+    for ax, side_params in ax_params_pairs:
+        y_lims = side_params["y_lims"]
+        ax_kwargs = {"yscale": ('log' if side_params["y_log_scale"] == True
+                                else 'linear'),
+                     "ylim": (y_lims[0], y_lims[1]),
+                     "ylabel": side_params["y_label"],
+                     "aspect": aspect}
+        if ax is ax_1:
+            ax_kwargs = {"xscale": ('log' if params.x_log_scale == True
+                                    else 'linear'),
+                         **ax_kwargs,
+                         "xlim": (x_lims[0], x_lims[1]),
+                         "xlabel": x_label,
+                         "title": params.title}
+        ax.set(**{key: val for key, val in ax_kwargs.items()
+                  if val is not None})
+
+    plt.setp([ax_1.xaxis.label] + [ax.yaxis.label for ax in axes],
+             fontsize=xy_label_ft_size)
+    if has_twin:
+        ax_2.yaxis.label.set_rotation(270)
+        ax_2.yaxis.labelpad = 25
+    ax_1.title.set_fontsize(params.title_ft_size)
 
 
 
     tick_label_ft_size = params.tick_label_ft_size
+    tick_width = 2.0 * linewidth / 3.0  # Also used for the axes frame.
     
     major_xtick_len = params.major_xtick_len
     minor_xtick_len = params.minor_xtick_len
@@ -586,97 +2165,72 @@ def single_plot(params):
     major_xtick_spacing = params.major_xtick_spacing
     minor_xtick_spacing = params.minor_xtick_spacing
 
-    plt.minorticks_on()
+    # Minor ticks are only shown on the x-axis and the right y-axis.
+    ax_1.xaxis.minorticks_on()
+    if has_twin:
+        ax_2.yaxis.minorticks_on()
     
-    if major_xtick_spacing != None:
-        x_major_locator = MultipleLocator(major_xtick_spacing)
+    if major_xtick_spacing is not None:
+        x_major_locator = _multiple_locator(ax_1.xaxis, major_xtick_spacing,
+                                            "major")
         ax_1.xaxis.set_major_locator(x_major_locator)
-    if minor_xtick_spacing != None:
-        x_minor_locator = MultipleLocator(minor_xtick_spacing)
+    if minor_xtick_spacing is not None:
+        x_minor_locator = _multiple_locator(ax_1.xaxis, minor_xtick_spacing,
+                                            "minor")
         ax_1.xaxis.set_minor_locator(x_minor_locator)
 
-    if left_major_ytick_spacing != None:
-        y_major_locator = MultipleLocator(left_major_ytick_spacing)
-        ax_1.yaxis.set_major_locator(y_major_locator)
-    if left_minor_ytick_spacing != None:
-        y_minor_locator = MultipleLocator(left_minor_ytick_spacing)
-        ax_1.yaxis.set_minor_locator(y_minor_locator)
-
-    if right_major_ytick_spacing != None:
-        y_major_locator = MultipleLocator(right_major_ytick_spacing)
-        ax_2.yaxis.set_major_locator(y_major_locator)
-    if right_minor_ytick_spacing != None:
-        y_minor_locator = MultipleLocator(right_minor_ytick_spacing)
-        ax_2.yaxis.set_minor_locator(y_minor_locator)
+    for ax, side_params in ax_params_pairs:
+        major_ytick_spacing = side_params["major_ytick_spacing"]
+        minor_ytick_spacing = side_params["minor_ytick_spacing"]
+        if major_ytick_spacing is not None:
+            y_major_locator = _multiple_locator(ax.yaxis, major_ytick_spacing,
+                                                "major")
+            ax.yaxis.set_major_locator(y_major_locator)
+        if minor_ytick_spacing is not None:
+            y_minor_locator = _multiple_locator(ax.yaxis, minor_ytick_spacing,
+                                                "minor")
+            ax.yaxis.set_minor_locator(y_minor_locator)
     
     ax_1.xaxis.set_ticks_position('both')
-    ax_1.yaxis.set_ticks_position('left')
-    ax_2.yaxis.set_ticks_position('right')
+    ax_1.yaxis.set_ticks_position('left' if has_twin else 'both')
     
-    ax_1.tick_params(axis='x', which='major',
+    # Configure the x- and y-axes together, only treating the y-axis
+    # separately if its tick lengths differ from those of the x-axis.
+    ax_1.tick_params(axis='both', which='major',
                      labelsize=tick_label_ft_size,
-                     width=2.0 * linewidth / 3.0,
+                     width=tick_width,
                      length=major_xtick_len, direction='in')
-    ax_1.tick_params(axis='x', which='minor',
-                     width=2.0 * linewidth / 3.0,
+    ax_1.tick_params(axis='both', which='minor',
+                     width=tick_width,
                      length=minor_xtick_len, direction='in')
+    if major_ytick_len != major_xtick_len:
+        ax_1.tick_params(axis='y', which='major', length=major_ytick_len)
+    if minor_ytick_len != minor_xtick_len:
+        ax_1.tick_params(axis='y', which='minor', length=minor_ytick_len)
 
-    ax_1.tick_params(axis='y', which='major',
-                     labelsize=tick_label_ft_size,
-                     width=2.0 * linewidth / 3.0,
-                     length=major_ytick_len, direction='in')
-    ax_1.tick_params(axis='y', which='minor',
-                     width=2.0 * linewidth / 3.0,
-                     length=minor_ytick_len, direction='in')
-
-    if num_right_xy_data_sets == 0:
-        labelright = False
-        y_min, y_max = ax_1.get_ylim()
-        y_ticks = ax_1.get_yticks(minor=True)
-        ax_2.set_yticks(y_ticks, minor=True)
-        ax_2.set_ylim(y_min, y_max)
-    else:
-        labelright = True
-    ax_2.tick_params(axis='y', which='major',
-                     labelsize=tick_label_ft_size,
-                     width=2.0 * linewidth / 3.0,
-                     length=major_ytick_len, direction='in',
-                     labelright=labelright)
-    ax_2.tick_params(axis='y', which='minor',
-                     width=2.0 * linewidth / 3.0,
-                     length=minor_ytick_len, direction='in',
-                     labelright=labelright)
-
-
-
-    for axis in ['top', 'bottom', 'left', 'right']:
-        ax_1.spines[axis].set_linewidth(2.0 * linewidth / 3.0)
-        ax_2.spines[axis].set_linewidth(2.0 * linewidth / 3.0)
-
-
+    if has_twin:
+        ax_2.yaxis.set_ticks_position('right')
+        ax_2.tick_params(axis='y', which='major',
+                         labelsize=tick_label_ft_size,
+                         width=tick_width,
+                         length=major_ytick_len, direction='in')
+        ax_2.tick_params(axis='y', which='minor',
+                         width=tick_width,
+                         length=minor_ytick_len, direction='in')
 
-    ax_1.set_title(params.title, fontsize=params.title_ft_size)
 
 
+    for ax in axes:
+        ax.spines[:].set_linewidth(tick_width)
 
-    aspect = params.aspect
-    ax_1.set_aspect(aspect)
-    ax_2.set_aspect(aspect)
-
-    scale = params.scale
-    fig_dims = fig.get_size_inches()
-    fig.set_figwidth(fig_dims[0] * scale)
-    fig.set_figheight(fig_dims[1] * scale)
 
 
+    _tight_layout(fig, axes, params)
 
-    fig.tight_layout(pad=1.08)
-    if params.show:
-        plt.show()
-    if isinstance(params.filename, str):
-        plt.savefig(params.filename, format=params.img_fmt)
+    result = (fig, ax_1, ax_2)
+    _finalize("single_plot", signature, result, params)
 
-    return None
+    return result
 
 
 
@@ -693,21 +2247,27 @@ class SingleImshowParams():
         Lower limit to the data range that the colormap covers.
     interpolation : `str` | `None`, optional
         The interpolation method used in generating the image.
-    append_axes_kwargs : `dict`, optional
+    append_axes_kwargs : `dict` | `None`, optional
         Keyword arguments specifying the positioning and size of the colorbar
-        axis.
-    colorbar_kwargs : `dict`, optional
-        Keyword arguments specifying properties of colorbar.
+        axis. If set to `None`, then ``{"position": "right", "size": "5%", 
+        "pad": 0.05}`` is used.
+    colorbar_kwargs : `dict` | `None`, optional
+        Keyword arguments specifying properties of colorbar. `None` is 
+        equivalent to ``{}``.
     xticks : array_like(`int`, ndim=1) | `None`, optional
-        Positions of ticks along x-axis.
+        Positions of ticks along x-axis. If set to `None`, the positions are
+        chosen automatically.
     yticks : array_like(`int`, ndim=1) | `None`, optional
-        Positions of ticks along y-axis.
+        Positions of ticks along y-axis. If set to `None`, the positions are
+        chosen automatically.
     cbticks : array_like(`int`, ndim=1) | `None`, optional
         Positions of colorbar ticks.
     xticklabels : array_like(`str`, ndim=1, length=len(``xticks``)) | `None`, optional
-        Tick labels along x-axis.
+        Tick labels along x-axis. If set to `None`, the default tick labels are
+        used.
     yticklabels : array_like(`str`, ndim=1, length=len(``yticks``)) | `None`, optional
-        Tick labels along y-axis.
+        Tick labels along y-axis. If set to `None`, the default tick labels are
+        used.
     cbticklabels : array_like(`str`, ndim=1, length=len(``xticks``)) | `None`, optional
         Colorbar tick labels along x-axis.
     xtick_len : `float`, optional
@@ -728,10 +2288,12 @@ class SingleImshowParams():
         Positions of vertical lines along x-axis.
     hlines : array_like(`float`, ndim=1), optional
         Positions of vertical lines along y-axis.
-    vline_kwargs : `dict`, optional
-        Keyword arguments specifying line properties of vertical lines.
-    hline_kwargs : `dict`, optional
-        Keyword arguments specifying line properties of horizontal lines.
+    vline_kwargs : `dict` | `None`, optional
+        Keyword arguments specifying line properties of vertical lines. `None`
+        is equivalent to ``{}``.
+    hline_kwargs : `dict` | `None`, optional
+        Keyword arguments specifying line properties of horizontal lines. 
+        `None` is equivalent to ``{}``.
     frame_thickness : `float`, optional
         Thickness of image frame.
     x_label : `str`, optional
@@ -761,48 +2323,114 @@ class SingleImshowParams():
     img_fmt : `str`, optional
         Image format.
     show : `bool`, optional
-        If set to `True`, show the plot, otherwise do not show the plot.
+        If set to `True`, show the plot, otherwise do not show the plot. The
+        plot is never shown if the matplotlib backend is non-interactive, e.g.
+        ``'agg'``. If set to `False` and ``filename`` is specified, the figure
+        is created without :mod:`matplotlib.pyplot`, hence it is not shown by
+        later calls to :func:`matplotlib.pyplot.show` either.
+    tight_layout : `bool`, optional
+        If set to `True`, :meth:`matplotlib.figure.Figure.tight_layout` is 
+        applied to the figure. Since this requires measuring all text in the
+        figure, it can be worthwhile to disable it when generating many 
+        figures whose layout is adjusted afterwards anyway, e.g. by calling
+        :func:`matplotlib.pyplot.tight_layout` once at the end of a script.
+    reuse_fig : `bool`, optional
+        If set to `False`, a new figure is created, which is not reused by 
+        subsequent calls either. If set to `True`, a figure previously 
+        generated by :func:`single_imshow` with the same layout, e.g. the same 
+        ``aspect`` and ``scale``, is cleared and redrawn rather than a new 
+        figure being created, provided that said figure is still open and was
+        also generated with ``reuse_fig`` set to `True`. The figure and axes
+        returned by the previous call are then the same objects as those 
+        returned by the current call, hence they no longer display what they
+        displayed before. This saves the cost of creating figures when e.g.
+        many figures are saved to files in a loop.
+    use_tex : `bool` | `None`, optional
+        If set to `True`, text is rendered using LaTeX. If set to `False`,
+        matplotlib's built-in mathtext is used instead, which is considerably
+        faster since no LaTeX processes need to be spawned. If set to `None`,
+        LaTeX is used if ``matplotlib.rcParams['text.usetex']`` is already 
+        `True`, or if any of the labels or titles contain TeX markup, i.e. a 
+        dollar sign or a backslash, in which case said rc parameter is set to
+        `True`.
+    prequantize : `bool`, optional
+        If set to `True`, and ``norm`` is either `None` or an instance of 
+        :class:`matplotlib.colors.Normalize` itself (rather than a subclass 
+        thereof), then ``z`` is mapped to 8-bit RGBA colors before being 
+        displayed. This reduces the memory traffic of displaying large images
+        considerably. The image is then resampled in RGBA space, which only 
+        differs noticeably from resampling ``z`` itself if the image is 
+        upsampled by a large factor.
+    dpi : `float` | `None`, optional
+        The resolution of the saved figure in dots per inch. The image and the
+        colorbar are rasterized even in vector formats such as PDF, in which 
+        case this is the resolution at which they are embedded. If set to 
+        `None`, ``matplotlib.rcParams['savefig.dpi']`` is used.
 
     Attributes
     ----------
     Same as parameters.
     """
+    # Attributes are stored in slots rather than in a per-instance dictionary.
+    __slots__ = ("z", "cmap", "norm", "interpolation", "append_axes_kwargs",
+                 "colorbar_kwargs", "xticks", "yticks", "cbticks",
+                 "xticklabels", "yticklabels", "cbticklabels", "xtick_len",
+                 "ytick_len", "cbtick_len", "xtick_width", "ytick_width",
+                 "cbtick_width", "tick_label_ft_size", "vlines", "hlines",
+                 "vline_kwargs", "hline_kwargs", "frame_thickness", "x_label",
+                 "y_label", "xy_label_ft_size", "title", "title_ft_size",
+                 "fig_label", "fig_label_coords", "fig_label_ft_size",
+                 "aspect", "scale", "filename", "img_fmt", "show",
+                 "tight_layout", "reuse_fig", "use_tex", "prequantize", "dpi")
+
+    # Names of the attributes storing the data to be plotted.
+    _data_keys = ("z",)
+
+    # Names of the attributes storing text that may contain TeX markup.
+    _text_keys = ("xticklabels", "yticklabels", "cbticklabels", "x_label",
+                  "y_label", "title", "fig_label")
+    
     def __init__(self,
                  z,
                  cmap=None, norm=None, interpolation=None,
-                 append_axes_kwargs={"position": "right",
-                                     "size": "5%",
-                                     "pad": 0.05},
-                 colorbar_kwargs={},
+                 append_axes_kwargs=None,
+                 colorbar_kwargs=None,
                  xticks=None, yticks=None, cbticks=None,
-                 xticklabels=None, yticklabels=None, cbticklabels=[],
+                 xticklabels=None, yticklabels=None, cbticklabels=(),
                  xtick_len=8, ytick_len=8, cbtick_len=8,
                  xtick_width=2, ytick_width=2, cbtick_width=2,
                  tick_label_ft_size=18,
-                 vlines=[], hlines=[], vline_kwargs={}, hline_kwargs={},
+                 vlines=(), hlines=(), vline_kwargs=None, hline_kwargs=None,
                  frame_thickness=2,
                  x_label='', y_label='', xy_label_ft_size=20,
                  title='', title_ft_size=20,
-                 fig_label='', fig_label_coords=[0.07, 0.91],
+                 fig_label='', fig_label_coords=(0.07, 0.91),
                  fig_label_ft_size=20,
                  aspect='auto', scale=1.,
-                 filename=None, img_fmt='pdf', show=True):
+                 filename=None, img_fmt='pdf', show=True, tight_layout=True,
+                 reuse_fig=False, use_tex=None, prequantize=False, dpi=None):
         self.z = z
 
         self.cmap = cmap
         self.norm = norm
         self.interpolation = interpolation
+        # Dictionaries are not used as default arguments, since default 
+        # arguments are shared between calls.
+        if append_axes_kwargs is None:
+            append_axes_kwargs = {"position": "right",
+                                  "size": "5%",
+                                  "pad": 0.05}
+        if colorbar_kwargs is None:
+            colorbar_kwargs = {}
         self.append_axes_kwargs = append_axes_kwargs
         self.colorbar_kwargs = colorbar_kwargs
 
-        self.xticks = range(z.shape[1]) if xticks == None else xticks
-        self.yticks = range(z.shape[0]) if yticks == None else yticks
+        self.xticks = xticks
+        self.yticks = yticks
         self.cbticks = cbticks
         
-        self.xticklabels = ([''] * z.shape[1] if xticklabels == None
-                            else xticklabels)
-        self.yticklabels = ([''] * z.shape[0] if yticklabels == None
-                            else yticklabels)
+        self.xticklabels = xticklabels
+        self.yticklabels = yticklabels
         self.cbticklabels = cbticklabels
         
         self.xtick_len = xtick_len
@@ -817,8 +2445,8 @@ class SingleImshowParams():
         
         self.vlines = vlines
         self.hlines = hlines
-        self.vline_kwargs = vline_kwargs
-        self.hline_kwargs = hline_kwargs
+        self.vline_kwargs = {} if vline_kwargs is None else vline_kwargs
+        self.hline_kwargs = {} if hline_kwargs is None else hline_kwargs
         
         self.frame_thickness = frame_thickness
         
@@ -839,14 +2467,51 @@ class SingleImshowParams():
         self.filename = filename
         self.img_fmt = img_fmt
         self.show = show
+        self.tight_layout = tight_layout
+        self.reuse_fig = reuse_fig
+        self.use_tex = use_tex
+        self.prequantize = prequantize
+        self.dpi = dpi
         
         return None
 
 
 
+    def _signature(self, include_data=True):
+        r"""Signature of the parameters that affect the generated figure.
+
+        Parameters
+        ----------
+        include_data : `bool`, optional
+            If set to `False`, the data to be plotted is excluded from the 
+            signature.
+
+        Returns
+        -------
+        signature : `tuple`
+            A hashable representation of all parameters except ``filename``,
+            ``img_fmt``, ``show``, and ``reuse_fig``. Two sets of parameters 
+            with equal signatures generate identical figures.
+        """
+        excluded_keys = ("filename", "img_fmt", "show", "reuse_fig")
+        if not include_data:
+            excluded_keys += self._data_keys
+        signature = _freeze({key: getattr(self, key) for key in self.__slots__
+                             if key not in excluded_keys})
+
+        return signature
+
+
+
 def single_imshow(params):
     r"""Generate a figure containing a single imshow plot.
 
+    If ``params.reuse_fig`` is `True`, and the most recent figure generated by
+    this function is still open, has not been changed since, and was 
+    generated using parameters with the same signature as ``params``, then 
+    the objects returned upon generating said figure are returned again 
+    rather than a new figure being generated.
+
     Parameters
     -----------
     params : :class:`SingleImshowParams`
@@ -854,105 +2519,151 @@ def single_imshow(params):
 
     Returns
     -------
-
+    fig : :class:`matplotlib.figure.Figure`
+        The figure. If ``params.reuse_fig`` is `True`, the figure and axes may
+        be those returned by a previous call, which are then cleared and 
+        redrawn, see :class:`SingleImshowParams`.
+    ax : :class:`matplotlib.axes.Axes`
+        The axes of the image.
+    im : :class:`matplotlib.image.AxesImage`
+        The image, whose data can be updated via its ``set_data`` method. If
+        ``z`` was mapped to RGBA colors, see ``params.prequantize``, then the 
+        image data are said colors.
+    cb : :class:`matplotlib.colorbar.Colorbar`
+        The colorbar.
     """
-    mpl.rcParams['text.usetex'] = True
-
-    fig = plt.figure()
-    ax = fig.add_subplot(111)
+    _lazy_import()
+
+    # Computing the signature requires hashing the data, hence it is only
+    # computed if the figure may be reused.
+    signature = params._signature() if params.reuse_fig else None
+    result = _reuse_last_fig("single_imshow", signature, params)
+    if result is not None:
+        return result
     
-    divider = make_axes_locatable(ax)
-    cax = divider.append_axes(**params.append_axes_kwargs)
+    _set_usetex(params)
+
+    fig_key = _layout_key(params) + (_uses_pyplot(params),)
+    fig, axes = ((None, None) if not params.reuse_fig
+                 else _reuse_cached_fig("single_imshow", fig_key))
+    if fig is None:
+        fig = _new_fig(params)
+        ax = fig.add_subplot(111)
+
+        # Only needed here, see the comment above `_lazy_import`.
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+        divider = make_axes_locatable(ax)
+        cax = divider.append_axes(**params.append_axes_kwargs)
+        if params.reuse_fig:
+            _cache_fig("single_imshow", fig_key, fig, (ax, cax))
+    else:
+        ax, cax = axes
 
 
     
-    im = ax.imshow(params.z,
-                   cmap=params.cmap,
-                   norm=params.norm,
-                   interpolation=params.interpolation)
+    z = params.z
+    cmap = _colormap(params.cmap)
+    norm = params.norm
+    if ((z.dtype == np.float64) and (z.nbytes > _float32_imshow_threshold)
+        and _float32_suffices(z, cmap, norm)):
+        # The displayed image only has 8 bits per color channel, hence single
+        # precision usually suffices and halves the memory traffic of 
+        # colormapping.
+        z = z.astype(np.float32, copy=False)
+    
+    # The extent of the image, with the first row of ``z`` at the top, also 
+    # fixes the y-limits of the axes, i.e. they are not expanded to include
+    # horizontal reference lines.
+    extent = (-0.5, z.shape[1]-0.5, z.shape[0]-0.5, -0.5)
+    
+    if (params.prequantize and (z.ndim == 2)
+        and ((norm is None) or (type(norm) is mpl.colors.Normalize))):
+        rgba, mappable = _prequantize(z, cmap, norm)
+        im = ax.imshow(rgba, interpolation=params.interpolation,
+                       extent=extent, origin='upper')
+    else:
+        im = ax.imshow(z,
+                       cmap=cmap,
+                       norm=norm,
+                       interpolation=params.interpolation,
+                       extent=extent,
+                       origin='upper')
+        mappable = im
+    ax.set_autoscaley_on(False)
+
+    cb = fig.colorbar(mappable, cax=cax, **params.colorbar_kwargs)
 
-    cb = fig.colorbar(im, cax=cax, **params.colorbar_kwargs)
+    # Avoid embedding every element of ``z`` in vector formats.
+    im.set_rasterized(True)
+    if cb.solids is not None:
+        cb.solids.set_rasterized(True)
 
 
 
-    ax.set_xticks(params.xticks)
-    ax.set_yticks(params.yticks)
-    if params.cbticks != None:
+    if params.xticks is not None:
+        ax.set_xticks(params.xticks)
+    if params.yticks is not None:
+        ax.set_yticks(params.yticks)
+    if params.cbticks is not None:
         cb.set_ticks(params.cbticks)
 
-    ax.set_xticklabels(params.xticklabels)
-    ax.set_yticklabels(params.yticklabels)
-    if params.cbticklabels != None:
-        cb.set_ticklabels(params.cbticklabels)
+    if params.xticklabels is not None:
+        _set_ticklabels(ax.xaxis, params.xticklabels)
+    if params.yticklabels is not None:
+        _set_ticklabels(ax.yaxis, params.yticklabels)
+    if params.cbticklabels is not None:
+        _set_ticklabels(cb.long_axis, params.cbticklabels)
 
-    ax.tick_params(axis='x', which='major',
+    ax.tick_params(axis='both', which='major',
                    labelsize=params.tick_label_ft_size,
                    length=params.xtick_len, width=params.xtick_width,
                    direction='out')
-    ax.tick_params(axis='y', which='major',
-                   labelsize=params.tick_label_ft_size,
-                   length=params.ytick_len, width=params.ytick_width,
-                   direction='out')
+    if ((params.ytick_len != params.xtick_len)
+        or (params.ytick_width != params.xtick_width)):
+        ax.tick_params(axis='y', which='major',
+                       length=params.ytick_len, width=params.ytick_width)
     cb.ax.tick_params(labelsize=params.tick_label_ft_size,
                       length=params.cbtick_len, width=params.cbtick_width)
 
 
     
-    # Fix bug in imshow, need to manually adjust y-limits for full display.
-    ax.set_ylim(-0.5+len(params.yticks), -0.5)
-
-
+    _add_ref_lines(ax, params.vlines, [params.vline_kwargs]*len(params.vlines),
+                   vertical=True)
+    _add_ref_lines(ax, params.hlines, [params.hline_kwargs]*len(params.hlines),
+                   vertical=False)
 
-    for vline in params.vlines:
-        ax.axvline(x=vline, **params.vline_kwargs)
 
-    for hline in params.hlines:
-        ax.axhline(y=hline, **params.hline_kwargs)
 
-
-
-    for axis in ['top', 'bottom', 'left', 'right']:
-        ax.spines[axis].set_linewidth(params.frame_thickness)
+    ax.spines[:].set_linewidth(params.frame_thickness)
 
     cb.outline.set_linewidth(params.frame_thickness)
     
 
-    ax.set_xlabel(params.x_label, fontsize=params.xy_label_ft_size)
-    ax.set_ylabel(params.y_label, fontsize=params.xy_label_ft_size)
-
-
-
-    ax.set_title(params.title, fontsize=params.title_ft_size)
+    ax.set(xlabel=params.x_label,
+           ylabel=params.y_label,
+           title=params.title,
+           aspect=params.aspect)
+    plt.setp([ax.xaxis.label, ax.yaxis.label],
+             fontsize=params.xy_label_ft_size)
+    ax.title.set_fontsize(params.title_ft_size)
     
 
     
-    fig_label = params.fig_label
-    fig_label_coords = params.fig_label_coords
-    fig_label_ft_size = params.fig_label_ft_size
-    ax.text(params.fig_label_coords[0], params.fig_label_coords[1],
-            params.fig_label, fontsize=params.fig_label_ft_size,
-            horizontalalignment='center', verticalalignment='center',
-            transform=fig.transFigure)
+    # An empty figure label is not drawn anyways, hence no artist is needed.
+    if params.fig_label:
+        ax.text(params.fig_label_coords[0], params.fig_label_coords[1],
+                params.fig_label, fontsize=params.fig_label_ft_size,
+                horizontalalignment='center', verticalalignment='center',
+                transform=fig.transFigure)
 
 
     
-    aspect = params.aspect
-    ax.set_aspect(aspect)
-
-    scale = params.scale
-    fig_dims = fig.get_size_inches()
-    fig.set_figwidth(fig_dims[0] * scale)
-    fig.set_figheight(fig_dims[1] * scale)
+    _tight_layout(fig, (ax, cax), params)
 
+    result = (fig, ax, im, cb)
+    _finalize("single_imshow", signature, result, params)
 
-    
-    fig.tight_layout(pad=1.08)
-    if params.show:
-        plt.show()
-    if isinstance(params.filename, str):
-        plt.savefig(params.filename, format=params.img_fmt)
-
-    return None
+    return result
 
 
 
@@ -1062,19 +2773,65 @@ class SingleHistParams():
     img_fmt : `str`, optional
         Image format.
     show : `bool`, optional
-        If set to `True`, show the plot, otherwise do not show the plot.
+        If set to `True`, show the plot, otherwise do not show the plot. The
+        plot is never shown if the matplotlib backend is non-interactive, e.g.
+        ``'agg'``. If set to `False` and ``filename`` is specified, the figure
+        is created without :mod:`matplotlib.pyplot`, hence it is not shown by
+        later calls to :func:`matplotlib.pyplot.show` either.
+    tight_layout : `bool`, optional
+        If set to `True`, :meth:`matplotlib.figure.Figure.tight_layout` is 
+        applied to the figure. Since this requires measuring all text in the
+        figure, it can be worthwhile to disable it when generating many 
+        figures whose layout is adjusted afterwards anyway, e.g. by calling
+        :func:`matplotlib.pyplot.tight_layout` once at the end of a script.
+    reuse_fig : `bool`, optional
+        If set to `True`, and the previous call to :func:`single_hist` was
+        made with the same parameters, apart from ``filename``, ``img_fmt`` 
+        and ``show``, and also with ``reuse_fig`` set to `True`, then the 
+        objects returned by said call are returned again, provided that its
+        figure is still open and has not been changed since. Unlike :func:`single_plot` and 
+        :func:`single_imshow`, :func:`single_hist` never clears and redraws a
+        previously returned figure, i.e. a new figure is created whenever the
+        parameters have changed.
+    use_tex : `bool` | `None`, optional
+        If set to `True`, text is rendered using LaTeX. If set to `False`,
+        matplotlib's built-in mathtext is used instead, which is considerably
+        faster since no LaTeX processes need to be spawned. If set to `None`,
+        LaTeX is used if ``matplotlib.rcParams['text.usetex']`` is already 
+        `True`, or if any of the labels or titles contain TeX markup, i.e. a 
+        dollar sign or a backslash, in which case said rc parameter is set to
+        `True`.
 
     Attributes
     ----------
     Same as parameters.
     """
+    # Attributes are stored in slots rather than in a per-instance dictionary.
+    __slots__ = ("x_data_sets", "bins", "cumulative", "normalized", "colors",
+                 "alphas", "axes_linewidth", "bar_edge_width", "x_lims",
+                 "y_lims", "x_log_scale", "y_log_scale", "x_label", "y_label",
+                 "xy_label_ft_size", "title", "title_ft_size", "legend_labels",
+                 "legend_loc", "legend_ft_size", "major_xtick_len",
+                 "minor_xtick_len", "major_ytick_len", "minor_ytick_len",
+                 "major_xtick_spacing", "minor_xtick_spacing",
+                 "major_ytick_spacing", "minor_ytick_spacing",
+                 "tick_label_ft_size", "fig_label", "fig_label_coords",
+                 "fig_label_ft_size", "aspect", "scale", "filename", "img_fmt",
+                 "show", "tight_layout", "reuse_fig", "use_tex")
+
+    # Names of the attributes storing the data to be plotted.
+    _data_keys = ("x_data_sets",)
+
+    # Names of the attributes storing text that may contain TeX markup.
+    _text_keys = ("x_label", "y_label", "legend_labels", "title", "fig_label")
+    
     def __init__(self,
                  x_data_sets,
                  bins=10,
                  cumulative=False,
                  normalized=False,
                  colors=None, alphas=0.8, axes_linewidth=3, bar_edge_width=2,
-                 x_lims=[None, None], y_lims=[None, None],
+                 x_lims=(None, None), y_lims=(None, None),
                  x_log_scale=False, y_log_scale=False,
                  x_label='', y_label='', xy_label_ft_size=20,
                  title='', title_ft_size=20,
@@ -1084,10 +2841,11 @@ class SingleHistParams():
                  major_xtick_spacing=None, minor_xtick_spacing=None,
                  major_ytick_spacing=None, minor_ytick_spacing=None,
                  tick_label_ft_size=18,
-                 fig_label='', fig_label_coords=[0.05, 0.93],
+                 fig_label='', fig_label_coords=(0.05, 0.93),
                  fig_label_ft_size=20,
                  aspect='auto', scale=1,
-                 filename=None, img_fmt='pdf', show=True):
+                 filename=None, img_fmt='pdf', show=True, tight_layout=True,
+                 reuse_fig=False, use_tex=None):
         self.x_data_sets = x_data_sets
         self.bins = bins
         self.cumulative = cumulative
@@ -1135,14 +2893,119 @@ class SingleHistParams():
         self.filename = filename
         self.img_fmt = img_fmt
         self.show = show
+        self.tight_layout = tight_layout
+        self.reuse_fig = reuse_fig
+        self.use_tex = use_tex
         
         return None
 
 
 
+    def _signature(self, include_data=True):
+        r"""Signature of the parameters that affect the generated figure.
+
+        Parameters
+        ----------
+        include_data : `bool`, optional
+            If set to `False`, the data to be plotted is excluded from the 
+            signature.
+
+        Returns
+        -------
+        signature : `tuple`
+            A hashable representation of all parameters except ``filename``,
+            ``img_fmt``, ``show``, and ``reuse_fig``. Two sets of parameters 
+            with equal signatures generate identical figures.
+        """
+        excluded_keys = ("filename", "img_fmt", "show", "reuse_fig")
+        if not include_data:
+            excluded_keys += self._data_keys
+        signature = _freeze({key: getattr(self, key) for key in self.__slots__
+                             if key not in excluded_keys})
+
+        return signature
+
+
+
+def _bin_x_data_sets(params):
+    r"""Bin the data sets of a histogram plot.
+
+    Parameters
+    ----------
+    params : :class:`SingleHistParams`
+        The plotting parameters.
+
+    Returns
+    -------
+    binned_x_data_sets : `list` (`tuple`)
+        ``binned_x_data_sets[i]`` is the pair ``(counts, edges)`` of the bin 
+        counts and the bin edges of ``params.x_data_sets[i]``, as returned by
+        :func:`numpy.histogram`.
+    """
+    x_data_sets = params.x_data_sets
+    num_x_data_sets = len(x_data_sets)
+    
+    bins_param = params.bins
+    x_log_scale = params.x_log_scale == True
+
+    # Only needed here, see the comment above `_lazy_import`.
+    from prettyplots._jit import min_max, histogram_many
+
+    # Data that is entirely in single precision is binned as is, rather than
+    # converted to double precision, which halves the memory traffic.
+    xs = [np.asarray(x_data_set.x).ravel() for x_data_set in x_data_sets]
+    dtype = (np.float32 if all(x.dtype == np.float32 for x in xs)
+             else np.float64)
+    xs = [x.astype(dtype, copy=False) for x in xs]
+
+    if isinstance(bins_param, int):
+        # The bins span the range of the data set in question, and are sorted
+        # by construction.
+        edges_set = np.empty((num_x_data_sets, bins_param+1))
+        for idx, x in enumerate(xs):
+            if x.size == 0:
+                raise ValueError("Cannot determine the bins of the empty x "
+                                 "data set `x_data_sets[{}]`, since "
+                                 "`bins` is an integer.".format(idx))
+            x_min, x_max = min_max(x)
+            if not (np.isfinite(x_min) and np.isfinite(x_max)):
+                # The same error as raised by `numpy.histogram`.
+                raise ValueError("autodetected range of [{}, {}] is not "
+                                 "finite".format(x_min, x_max))
+            if x_log_scale:
+                edges_set[idx] = np.logspace(np.log10(x_min), np.log10(x_max),
+                                             bins_param+1)
+            else:
+                edges_set[idx] = np.linspace(x_min, x_max, num=bins_param+1)
+    else:
+        # Explicit bin edges are common to all data sets, hence they are only
+        # prepared once.
+        shared_bins = np.sort(bins_param)
+        if x_log_scale:
+            shared_bins = np.logspace(np.log10(shared_bins[0]),
+                                      np.log10(shared_bins[-1]),
+                                      len(shared_bins))
+        edges_set = np.broadcast_to(np.asarray(shared_bins, dtype=np.float64),
+                                    (num_x_data_sets, len(shared_bins)))
+
+    # All data sets are binned at once, in parallel if ``numba`` is available.
+    offsets = np.cumsum([0] + [x.size for x in xs])
+    counts_set = histogram_many(np.concatenate(xs), offsets, edges_set)
+    binned_x_data_sets = list(zip(counts_set, edges_set))
+
+    return binned_x_data_sets
+
+
+
 def single_hist(params):
     r"""Generate a histogram plot based on the parameters specified in params.
 
+    If ``params.reuse_fig`` is `True`, and the most recent figure generated by
+    this function is still open, has not been changed since, and was 
+    generated using parameters with the same signature as ``params``, then 
+    the objects returned upon generating said figure are returned again 
+    rather than a new figure being generated.
+
     Parameters
     -----------
     params : :class:`SinglePlotParams`
@@ -1150,11 +3013,23 @@ def single_hist(params):
 
     Returns
     -------
-
+    fig : :class:`matplotlib.figure.Figure`
+        The figure.
+    ax : :class:`matplotlib.axes.Axes`
+        The axes of the histograms.
     """
-    mpl.rcParams['text.usetex'] = True
+    _lazy_import()
+
+    # Computing the signature requires hashing the data, hence it is only
+    # computed if the figure may be reused.
+    signature = params._signature() if params.reuse_fig else None
+    result = _reuse_last_fig("single_hist", signature, params)
+    if result is not None:
+        return result
 
-    fig = plt.figure()
+    _set_usetex(params)
+
+    fig = _new_fig(params)
     ax = fig.add_subplot(111)
 
 
@@ -1173,73 +3048,69 @@ def single_hist(params):
     
     legend_labels = params.legend_labels
     no_legend = False
-    if legend_labels == None:
+    if legend_labels is None:
         legend_labels = [None] * num_x_data_sets
         no_legend = True
 
-    colors = params.colors
-    if colors == None:
-        colors = [None] * num_x_data_sets
-    else:
-        colors = _to_np_array(colors)
-        if colors.size == 1:
-            colors = np.resize(colors, num_x_data_sets)
-
-    alphas = _to_np_array(params.alphas)
-    if alphas.size == 1:
-        alphas = np.resize(alphas, num_x_data_sets)
+    colors = _broadcast(params.colors, num_x_data_sets)
+    alphas = _broadcast(params.alphas, num_x_data_sets)
 
 
         
-    for idx in range(num_x_data_sets):
-        x = x_data_sets[idx].x
-        
-        bins = params.bins
-        if isinstance(bins, int):
-            bins = np.linspace(np.amin(x), np.amax(x), num=bins+1)
-        bins = np.sort(bins)
-
-        if params.x_log_scale == True:
-            log_bins = np.logspace(np.log10(bins[0]),
-                                   np.log10(bins[-1]),
-                                   len(bins))
-
-            ax.hist(x, bins=log_bins, linewidth=bar_edge_width,
-                    alpha=alphas[idx], histtype=hist_type,
-                    cumulative=cumulative, density=normalized,
-                    facecolor=colors[idx], label=legend_labels[idx])
-            
-        else:
-            ax.hist(x, bins=bins, linewidth=bar_edge_width, 
-                    alpha=alphas[idx], histtype=hist_type, 
-                    cumulative=cumulative, density=normalized,
-                    facecolor=colors[idx], label=legend_labels[idx])
+    # Each data set is binned only once, the resulting counts being reused for
+    # all the artists representing the histogram of said data set.
+    binned_x_data_sets = _bin_x_data_sets(params)
 
-    # Need to plot twice to avoid transparent bar edges.
     if hist_type == "bar":
-        bar_edge_width = params.bar_edge_width
-            
-        for idx in range(num_x_data_sets):
-            x = x_data_sets[idx].x
+        if params.colors is None:
+            # Bars without a specified color take on the default patch color.
+            colors = [mpl.rcParams['patch.facecolor']] * num_x_data_sets
         
-            bins = params.bins
-            if isinstance(bins, int):
-                bins = np.linspace(np.amin(x), np.amax(x), num=bins+1)
-                bins = np.sort(bins)
-
-            if params.x_log_scale == True:
-                log_bins = np.logspace(np.log10(bins[0]),
-                                       np.log10(bins[-1]),
-                                       len(bins))
-
-                ax.hist(x, bins=log_bins,
-                        facecolor="None", density=normalized,
-                        edgecolor='black', linewidth=bar_edge_width)
+        bar_outlines = []
+        for idx in range(num_x_data_sets):
+            counts, edges = binned_x_data_sets[idx]
+            bar_widths = np.diff(edges)
+            heights = (counts / bar_widths / counts.sum()
+                       if normalized else counts)
             
-            else:
-                ax.hist(x, bins=bins,
-                        facecolor="None", density=normalized,
-                        edgecolor='black', linewidth=bar_edge_width)
+            # The vertices of the bars, in the order (left, bottom), 
+            # (right, bottom), (right, top), and (left, top).
+            outlines = np.zeros((heights.size, 4, 2))
+            outlines[:, (0, 3), 0] = edges[:-1, None]
+            outlines[:, (1, 2), 0] = edges[1:, None]
+            outlines[:, 2:, 1] = heights[:, None]
+            bar_outlines.append(outlines)
+
+            # A single collection of bars per data set, rather than a patch
+            # per bar. Like bars, the collection may not be padded below zero
+            # when autoscaling.
+            fill_collection = PolyCollection(outlines, closed=True,
+                                             facecolors=colors[idx],
+                                             edgecolors="none",
+                                             alpha=alphas[idx],
+                                             label=legend_labels[idx])
+            fill_collection.sticky_edges.y.append(0)
+            ax.add_collection(fill_collection)
+
+        # The bar edges are drawn on top of all the bars to avoid transparent
+        # bar edges. A single collection suffices for all data sets.
+        edge_collection = PolyCollection(np.concatenate(bar_outlines),
+                                         closed=True, facecolors="none",
+                                         edgecolors='black',
+                                         linewidths=params.bar_edge_width,
+                                         joinstyle='miter')
+        ax.add_collection(edge_collection, autolim=False)
+    else:
+        for idx in range(num_x_data_sets):
+            counts, edges = binned_x_data_sets[idx]
+            # The left bin edges, weighted by the bin counts, are binned
+            # instead of the data itself, which is cheap and yields the same
+            # (cumulative) step outline.
+            ax.hist(edges[:-1], bins=edges, weights=counts,
+                    linewidth=bar_edge_width, alpha=alphas[idx],
+                    histtype=hist_type, cumulative=cumulative,
+                    density=normalized, facecolor=colors[idx],
+                    label=legend_labels[idx])
 
 
 
@@ -1251,37 +3122,33 @@ def single_hist(params):
         ax.legend(loc=legend_loc, frameon=True, fontsize=legend_ft_size)
 
 
-    
-    ax.set_title(params.title, fontsize=params.title_ft_size)
-
-
-
+    # An empty figure label is not drawn anyways, hence no artist is needed,
+    # unless the legend is placed so as to avoid it.
     fig_label = params.fig_label
-    fig_label_coords = params.fig_label_coords
-    fig_label_ft_size = params.fig_label_ft_size
-    ax.text(fig_label_coords[0], fig_label_coords[1], fig_label,
-            fontsize=fig_label_ft_size, horizontalalignment='center',
-            verticalalignment='center', transform=ax.transAxes)
-
+    if fig_label or ((not no_legend) and _is_best_legend_loc(legend_loc)):
+        fig_label_coords = params.fig_label_coords
+        fig_label_ft_size = params.fig_label_ft_size
+        ax.text(fig_label_coords[0], fig_label_coords[1], fig_label,
+                fontsize=fig_label_ft_size, horizontalalignment='center',
+                verticalalignment='center', transform=ax.transAxes)
 
 
-    x_label = params.x_label
-    y_label = params.y_label
-    xy_label_ft_size = params.xy_label_ft_size
-    ax.set_xlabel(x_label, fontsize=xy_label_ft_size)
-    ax.set_ylabel(y_label, fontsize=xy_label_ft_size)
-
 
-
-    if params.x_log_scale == True:
-        ax.set_xscale('log')
-    if params.y_log_scale == True:
-        ax.set_yscale('log')
-    
+    # Scales must be set before the limits. Linear scales are the default.
     x_min, x_max = params.x_lims
     y_min, y_max = params.y_lims
-    ax.set_xlim(x_min, x_max)
-    ax.set_ylim(y_min, y_max)
+    ax_kwargs = {"xscale": 'log' if params.x_log_scale == True else None,
+                 "yscale": 'log' if params.y_log_scale == True else None,
+                 "xlim": (x_min, x_max),
+                 "ylim": (y_min, y_max),
+                 "xlabel": params.x_label,
+                 "ylabel": params.y_label,
+                 "title": params.title,
+                 "aspect": params.aspect}
+    ax.set(**{key: val for key, val in ax_kwargs.items() if val is not None})
+
+    plt.setp([ax.xaxis.label, ax.yaxis.label], fontsize=params.xy_label_ft_size)
+    ax.title.set_fontsize(params.title_ft_size)
 
 
 
@@ -1297,63 +3164,83 @@ def single_hist(params):
     major_ytick_spacing = params.major_ytick_spacing
     minor_ytick_spacing = params.minor_ytick_spacing
 
-    plt.minorticks_on()
+    ax.minorticks_on()
     
-    if major_xtick_spacing != None:
-        x_major_locator = MultipleLocator(major_xtick_spacing)
+    if major_xtick_spacing is not None:
+        x_major_locator = _multiple_locator(ax.xaxis, major_xtick_spacing,
+                                            "major")
         ax.xaxis.set_major_locator(x_major_locator)
-    if minor_xtick_spacing != None:
-        x_minor_locator = MultipleLocator(minor_xtick_spacing)
+    if minor_xtick_spacing is not None:
+        x_minor_locator = _multiple_locator(ax.xaxis, minor_xtick_spacing,
+                                            "minor")
         ax.xaxis.set_minor_locator(x_minor_locator)
 
-    if major_ytick_spacing != None:
-        y_major_locator = MultipleLocator(major_ytick_spacing)
+    if major_ytick_spacing is not None:
+        y_major_locator = _multiple_locator(ax.yaxis, major_ytick_spacing,
+                                            "major")
         ax.yaxis.set_major_locator(y_major_locator)
-    if minor_ytick_spacing != None:
-        y_minor_locator = MultipleLocator(minor_ytick_spacing)
+    if minor_ytick_spacing is not None:
+        y_minor_locator = _multiple_locator(ax.yaxis, minor_ytick_spacing,
+                                            "minor")
         ax.yaxis.set_minor_locator(y_minor_locator)
     
     ax.xaxis.set_ticks_position('both')
     ax.yaxis.set_ticks_position('both')
 
     axes_linewidth = params.axes_linewidth
+    tick_width = 2.0 * axes_linewidth / 3.0  # Also used for the axes frame.
     
-    ax.tick_params(axis='x', which='major',
+    # Configure the x- and y-axes together, only treating the y-axis
+    # separately if its tick lengths differ from those of the x-axis.
+    ax.tick_params(axis='both', which='major',
                    labelsize=tick_label_ft_size,
-                   width=2.0 * axes_linewidth / 3.0,
+                   width=tick_width,
                    length=major_xtick_len, direction='in')
-    ax.tick_params(axis='x', which='minor',
-                   width=2.0 * axes_linewidth / 3.0,
+    ax.tick_params(axis='both', which='minor',
+                   width=tick_width,
                    length=minor_xtick_len, direction='in')
-    ax.tick_params(axis='y', which='major',
-                   labelsize=tick_label_ft_size,
-                   width=2.0 * axes_linewidth / 3.0,
-                   length=major_ytick_len, direction='in')
-    ax.tick_params(axis='y', which='minor',
-                   width=2.0 * axes_linewidth / 3.0,
-                   length=minor_ytick_len, direction='in')
+    if major_ytick_len != major_xtick_len:
+        ax.tick_params(axis='y', which='major', length=major_ytick_len)
+    if minor_ytick_len != minor_xtick_len:
+        ax.tick_params(axis='y', which='minor', length=minor_ytick_len)
 
 
 
-    for axis in ['top', 'bottom', 'left', 'right']:
-        ax.spines[axis].set_linewidth(2.0 * axes_linewidth / 3.0)
+    ax.spines[:].set_linewidth(tick_width)
 
 
 
-    aspect = params.aspect
-    ax.set_aspect(aspect)
+    _tight_layout(fig, (ax,), params)
 
-    scale = params.scale
-    fig_dims = fig.get_size_inches()
-    fig.set_figwidth(fig_dims[0] * scale)
-    fig.set_figheight(fig_dims[1] * scale)
+    result = (fig, ax)
+    _finalize("single_hist", signature, result, params)
 
+    return result
 
-    
-    fig.tight_layout(pad=1.08)
-    if params.show:
-        plt.show()
-    if isinstance(params.filename, str):
-        plt.savefig(params.filename, format=params.img_fmt)
 
-    return None
+
+def single_hist_counts(params):
+    r"""Bin the data sets of a histogram plot without plotting them.
+
+    The data sets are binned exactly as done by :func:`single_hist`, but no
+    figure is created, hence ``matplotlib`` is not even imported. This is
+    useful when only the histogram data is of interest.
+
+    Parameters
+    -----------
+    params : :class:`SingleHistParams`
+        The plotting parameters. Only ``params.x_data_sets``, 
+        ``params.bins``, and ``params.x_log_scale`` are used.
+
+    Returns
+    -------
+    binned_x_data_sets : `list` (`tuple`)
+        ``binned_x_data_sets[i]`` is the pair ``(counts, edges)`` of the bin 
+        counts and the bin edges of ``params.x_data_sets[i]``, as returned by
+        :func:`numpy.histogram`. The counts are neither normalized nor 
+        accumulated, regardless of ``params.normalized`` and 
+        ``params.cumulative``.
+    """
+    binned_x_data_sets = _bin_x_data_sets(params)
+
+    return binned_x_data_sets
@@ -18,6 +18,12 @@ import os
 # To run git commands and retrieve corresponding output.
 import subprocess
 
+# For caching the git revision hash.
+import functools
+
+# For combining the extra library requirements.
+import itertools
+
 
 
 # For setting up prettyplots package.
@@ -63,9 +69,58 @@ VERSION = '{0:d}.{1:d}.{2:d}'.format(MAJOR, MINOR, MICRO)
 
 
 
+def read_git_revision():
+    """Read revision hash of ``prettyplots`` directly from the git directory.
+
+    Parameters
+    ----------
+
+    Returns
+    -------
+    revision : `str` | `None`
+        Git revision hash of ``prettyplots``, or `None` if it could not be read
+        from the files in ``.git``, e.g. if ``.git`` is not a directory.
+    """
+    try:
+        with open(os.path.join('.git', 'HEAD'), 'r') as file_obj:
+            head = file_obj.read().strip()
+    except OSError:
+        return None
+
+    if not head.startswith('ref: '):
+        revision = head  # Detached HEAD.
+        return revision
+
+    ref = head[len('ref: '):]
+    try:
+        with open(os.path.join('.git', ref), 'r') as file_obj:
+            revision = file_obj.read().strip()
+        return revision
+    except OSError:
+        pass
+
+    # The ref may only be stored in the packed refs.
+    try:
+        with open(os.path.join('.git', 'packed-refs'), 'r') as file_obj:
+            for line in file_obj:
+                fields = line.split()
+                if (len(fields) == 2) and (fields[1] == ref):
+                    revision = fields[0]
+                    return revision
+    except OSError:
+        pass
+
+    return None
+
+
+
+@functools.lru_cache(maxsize=None)
 def get_git_revision():
     """Get revision hash of ``prettyplots`` from git.
 
+    The revision hash is read directly from the files in ``.git`` if possible,
+    which is much faster than running git.
+
     Parameters
     ----------
 
@@ -74,6 +129,10 @@ def get_git_revision():
     revision : `str`
         Git revision hash of ``prettyplots``.
     """
+    revision = read_git_revision()
+    if revision is not None:
+        return revision
+    
     if not os.path.exists('.git'):
         revision = "unknown"
     else:
@@ -82,9 +141,11 @@ def get_git_revision():
             cwd = os.path.dirname(os.path.abspath(__file__))
             stderr = subprocess.STDOUT
 
+            # A timeout avoids hanging on e.g. a corrupt repository.
             cmd_output = subprocess.check_output(parsed_cmd,
                                                  cwd=cwd,
-                                                 stderr=stderr)
+                                                 stderr=stderr,
+                                                 timeout=2)
             revision = cmd_output.decode().strip()
             
         except:
@@ -119,6 +180,8 @@ def write__version_py(full_version,
                       filename="prettyplots/_version.py"):
     """Write the version during compilation to file.
 
+    The file is only written if its content would change.
+
     Parameters
     ----------
     full_version : `str`
@@ -159,6 +222,15 @@ def write__version_py(full_version,
                              released=RELEASED,
                              git_revision=git_revision)
 
+    # Leaving an up-to-date file untouched preserves its modification time,
+    # hence nothing that depends on it is rebuilt needlessly.
+    try:
+        with open(filename, 'r') as file_obj:
+            if file_obj.read() == content:
+                return None
+    except OSError:
+        pass
+
     with open(filename, 'w') as file_obj:
         print(filename)
         file_obj.write(content)
@@ -181,9 +253,8 @@ def read_requirements_file(filename):
         Extracted set of library requirements.
     """
     with open(filename, 'r') as file_obj:
-        requirements = file_obj.readlines()
-
-    requirements = [line.strip() for line in requirements if line.strip()]
+        stripped_lines = (line.strip() for line in file_obj)
+        requirements = [line for line in stripped_lines if line]
         
     return requirements
 
@@ -199,10 +270,10 @@ def read_extra_requirements():
     extra_requirements : `dict` [`str`, array_like(`str`, ndim=1)]
         Extracted set of library requirements.
     """
-    extra_requirements = {'doc': read_requirements_file('requirements-doc.txt')}
-    extra_requirements['all'] = [requirement for requirement_subset
-                                 in extra_requirements.values()
-                                 for requirement in requirement_subset]
+    extra_requirements = {'doc': read_requirements_file('requirements-doc.txt'),
+                          'jit': read_requirements_file('requirements-jit.txt')}
+    extra_requirements['all'] = \
+        list(itertools.chain.from_iterable(extra_requirements.values()))
     
     return extra_requirements
 